@@ -8,6 +8,7 @@ import (
 	"encoding/binary"
 	"encoding/json"
 	"fmt"
+	"hash/fnv"
 	"io"
 	"math"
 	"math/rand"
@@ -18,6 +19,7 @@ import (
 	"reflect"
 	"strconv"
 	"strings"
+	"sync"
 	"syscall"
 	"time"
 
@@ -46,6 +48,10 @@ type Message struct {
 // Database handler for storing message history
 type MessageStore struct {
 	db *sql.DB
+
+	// In-memory copy of watched_channels, checked for every incoming message
+	watchedMu sync.RWMutex
+	watched   map[string]struct{}
 }
 
 // Initialize message store
@@ -55,8 +61,8 @@ func NewMessageStore() (*MessageStore, error) {
 		return nil, fmt.Errorf("failed to create store directory: %v", err)
 	}
 
-	// Open SQLite database for messages
-	db, err := sql.Open("sqlite3", "file:store/messages.db?_foreign_keys=on")
+	// Open SQLite database for messages (WAL lets the MCP server read while the bridge writes)
+	db, err := sql.Open("sqlite3", "file:store/messages.db?_foreign_keys=on&_recursive_triggers=on&_journal_mode=WAL&_synchronous=NORMAL")
 	if err != nil {
 		return nil, fmt.Errorf("failed to open message database: %v", err)
 	}
@@ -116,6 +122,7 @@ func NewMessageStore() (*MessageStore, error) {
 	// Run migrations for existing databases
 	store := &MessageStore{db: db}
 	store.runMigrations()
+	store.loadWatchedChannels()
 
 	return store, nil
 }
@@ -155,6 +162,100 @@ func (store *MessageStore) runMigrations() {
 			fmt.Printf("Added column archived to chats table\n")
 		}
 	}
+
+	// Indexes backing keyset pagination in the MCP server
+	indexes := []string{
+		"CREATE INDEX IF NOT EXISTS idx_messages_chat_ts ON messages(chat_jid, timestamp DESC, id DESC)",
+		"CREATE INDEX IF NOT EXISTS idx_messages_ts_id ON messages(timestamp DESC, id DESC)",
+		// Sender filters (list_messages by phone number, contact chats, last interaction)
+		"CREATE INDEX IF NOT EXISTS idx_messages_sender_ts ON messages(sender, timestamp DESC, id DESC)",
+		"CREATE INDEX IF NOT EXISTS idx_chats_last_active ON chats(IFNULL(last_message_time, '') DESC, jid DESC)",
+		"CREATE INDEX IF NOT EXISTS idx_chats_name_nocase ON chats(IFNULL(name, '') COLLATE NOCASE, jid)",
+		// Phone number (user part) of the JID, for exact contact lookups without LIKE '%...%' scans
+		"CREATE INDEX IF NOT EXISTS idx_chats_phone ON chats(substr(jid, 1, instr(jid, '@') - 1))",
+	}
+	for _, stmt := range indexes {
+		if _, err := store.db.Exec(stmt); err != nil {
+			fmt.Printf("Warning: Could not create index: %v\n", err)
+		}
+	}
+
+	// Full-text index used by list_messages query searches (requires building with -tags sqlite_fts5).
+	// The triggers keep it in sync; REPLACE fires the delete trigger because the DSN enables recursive_triggers.
+	var ftsCount int
+	err = store.db.QueryRow(
+		"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'",
+	).Scan(&ftsCount)
+	if err != nil || ftsCount == 0 {
+		_, err = store.db.Exec(`
+			CREATE VIRTUAL TABLE messages_fts USING fts5(
+				content, media_type, filename,
+				content='messages', content_rowid='rowid',
+				tokenize='unicode61 remove_diacritics 2'
+			);
+			CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+				INSERT INTO messages_fts(rowid, content, media_type, filename)
+				VALUES (new.rowid, new.content, new.media_type, new.filename);
+			END;
+			CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+				INSERT INTO messages_fts(messages_fts, rowid, content, media_type, filename)
+				VALUES ('delete', old.rowid, old.content, old.media_type, old.filename);
+			END;
+			CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE ON messages BEGIN
+				INSERT INTO messages_fts(messages_fts, rowid, content, media_type, filename)
+				VALUES ('delete', old.rowid, old.content, old.media_type, old.filename);
+				INSERT INTO messages_fts(rowid, content, media_type, filename)
+				VALUES (new.rowid, new.content, new.media_type, new.filename);
+			END;
+			INSERT INTO messages_fts(messages_fts) VALUES ('rebuild');
+		`)
+		if err != nil {
+			fmt.Printf("Warning: Could not create messages_fts full-text index: %v\n", err)
+		} else {
+			fmt.Printf("Created messages_fts full-text index\n")
+		}
+	}
+
+	// Trigram index over contact chat names and JIDs so search_contacts can match substrings
+	// without a table scan. Group chats are never searched as contacts, so they stay out of it,
+	// and the update trigger only re-indexes a chat when its name or JID actually changes.
+	// Indexes built before these rules had unfiltered triggers; they are recreated and refilled.
+	var chatsFtsTriggerSQL string
+	store.db.QueryRow(
+		"SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'chats_fts_au'",
+	).Scan(&chatsFtsTriggerSQL)
+	if !strings.Contains(chatsFtsTriggerSQL, "@g.us") {
+		_, err = store.db.Exec(`
+			CREATE VIRTUAL TABLE IF NOT EXISTS chats_fts USING fts5(
+				name, jid,
+				content='chats', content_rowid='rowid',
+				tokenize='trigram'
+			);
+			DROP TRIGGER IF EXISTS chats_fts_ai;
+			DROP TRIGGER IF EXISTS chats_fts_ad;
+			DROP TRIGGER IF EXISTS chats_fts_au;
+			CREATE TRIGGER chats_fts_ai AFTER INSERT ON chats WHEN new.jid NOT LIKE '%@g.us' BEGIN
+				INSERT INTO chats_fts(rowid, name, jid) VALUES (new.rowid, new.name, new.jid);
+			END;
+			CREATE TRIGGER chats_fts_ad AFTER DELETE ON chats WHEN old.jid NOT LIKE '%@g.us' BEGIN
+				INSERT INTO chats_fts(chats_fts, rowid, name, jid) VALUES ('delete', old.rowid, old.name, old.jid);
+			END;
+			CREATE TRIGGER chats_fts_au AFTER UPDATE OF name, jid ON chats
+			WHEN old.name IS NOT new.name OR old.jid IS NOT new.jid BEGIN
+				INSERT INTO chats_fts(chats_fts, rowid, name, jid)
+				SELECT 'delete', old.rowid, old.name, old.jid WHERE old.jid NOT LIKE '%@g.us';
+				INSERT INTO chats_fts(rowid, name, jid)
+				SELECT new.rowid, new.name, new.jid WHERE new.jid NOT LIKE '%@g.us';
+			END;
+			INSERT INTO chats_fts(chats_fts) VALUES ('delete-all');
+			INSERT INTO chats_fts(rowid, name, jid) SELECT rowid, name, jid FROM chats WHERE jid NOT LIKE '%@g.us';
+		`)
+		if err != nil {
+			fmt.Printf("Warning: Could not create chats_fts trigram index: %v\n", err)
+		} else {
+			fmt.Printf("Created chats_fts trigram index\n")
+		}
+	}
 }
 
 // migrateLIDChats moves messages stored under LID JIDs to their phone-number JID equivalents.
@@ -258,8 +359,15 @@ func (store *MessageStore) Close() error {
 
 // Store a chat in the database
 func (store *MessageStore) StoreChat(jid, name string, lastMessageTime time.Time) error {
+	// An upsert updates the row in place, so chats_fts is only touched when the name
+	// changes; INSERT OR REPLACE deleted and re-inserted (and re-indexed) it every time.
+	// archived is reset to its default, as the REPLACE did, so a new message unarchives.
 	_, err := store.db.Exec(
-		"INSERT OR REPLACE INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)",
+		`INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)
+		ON CONFLICT(jid) DO UPDATE SET
+			name = excluded.name,
+			last_message_time = excluded.last_message_time,
+			archived = 0`,
 		jid, name, lastMessageTime,
 	)
 	return err
@@ -385,6 +493,11 @@ type SendMessageRequest struct {
 	ReplyToJID  string `json:"reply_to_jid,omitempty"` // JID of the sender of the message being replied to
 }
 
+// SendBatchRequest represents the request body for the batch send API
+type SendBatchRequest struct {
+	Messages []SendMessageRequest `json:"messages"`
+}
+
 // ScheduledMessage represents a message scheduled for future delivery
 type ScheduledMessage struct {
 	ID            int64     `json:"id"`
@@ -451,22 +564,34 @@ func (store *MessageStore) GetScheduledMessage(id int64) (*ScheduledMessage, err
 	return &msg, nil
 }
 
-// Get all scheduled messages with optional status filter
-func (store *MessageStore) GetScheduledMessages(status string) ([]ScheduledMessage, error) {
-	var rows *sql.Rows
-	var err error
+// Get scheduled messages with optional status filter, one page at a time when limit > 0
+func (store *MessageStore) GetScheduledMessages(status string, afterTime time.Time, afterID int64, limit int) ([]ScheduledMessage, error) {
+	query := "SELECT id, recipient, message, media_path, scheduled_time, status, created_at, sent_at, error FROM scheduled_messages"
+	var conditions []string
+	var args []interface{}
 
 	if status != "" {
-		rows, err = store.db.Query(
-			"SELECT id, recipient, message, media_path, scheduled_time, status, created_at, sent_at, error FROM scheduled_messages WHERE status = ? ORDER BY scheduled_time ASC",
-			status,
-		)
-	} else {
-		rows, err = store.db.Query(
-			"SELECT id, recipient, message, media_path, scheduled_time, status, created_at, sent_at, error FROM scheduled_messages ORDER BY scheduled_time ASC",
-		)
+		conditions = append(conditions, "status = ?")
+		args = append(args, status)
+	}
+
+	// Keyset pagination: resume after the (scheduled_time, id) of the previous page's last row
+	if afterID > 0 {
+		conditions = append(conditions, "(scheduled_time, id) > (?, ?)")
+		args = append(args, afterTime, afterID)
+	}
+
+	if len(conditions) > 0 {
+		query += " WHERE " + strings.Join(conditions, " AND ")
 	}
+	query += " ORDER BY scheduled_time ASC, id ASC"
 
+	if limit > 0 {
+		query += " LIMIT ?"
+		args = append(args, limit)
+	}
+
+	rows, err := store.db.Query(query, args...)
 	if err != nil {
 		return nil, err
 	}
@@ -582,7 +707,16 @@ func (store *MessageStore) AddWatchedChannel(jid, name string) error {
 		"INSERT OR REPLACE INTO watched_channels (jid, name, created_at) VALUES (?, ?, datetime('now'))",
 		jid, name,
 	)
-	return err
+	if err != nil {
+		return err
+	}
+
+	store.watchedMu.Lock()
+	if store.watched != nil {
+		store.watched[jid] = struct{}{}
+	}
+	store.watchedMu.Unlock()
+	return nil
 }
 
 // Remove a channel from the watch list
@@ -598,9 +732,98 @@ func (store *MessageStore) RemoveWatchedChannel(jid string) error {
 	if rows == 0 {
 		return fmt.Errorf("channel not found in watch list")
 	}
+
+	store.watchedMu.Lock()
+	delete(store.watched, jid)
+	store.watchedMu.Unlock()
 	return nil
 }
 
+// Add several channels to the watch list in one transaction
+func (store *MessageStore) AddWatchedChannels(jids, names []string) error {
+	tx, err := store.db.Begin()
+	if err != nil {
+		return err
+	}
+	stmt, err := tx.Prepare("INSERT OR REPLACE INTO watched_channels (jid, name, created_at) VALUES (?, ?, datetime('now'))")
+	if err != nil {
+		tx.Rollback()
+		return err
+	}
+	defer stmt.Close()
+
+	for i, jid := range jids {
+		if _, err := stmt.Exec(jid, names[i]); err != nil {
+			tx.Rollback()
+			return err
+		}
+	}
+	if err := tx.Commit(); err != nil {
+		return err
+	}
+
+	store.watchedMu.Lock()
+	if store.watched != nil {
+		for _, jid := range jids {
+			store.watched[jid] = struct{}{}
+		}
+	}
+	store.watchedMu.Unlock()
+	return nil
+}
+
+// Remove several channels from the watch list in one transaction, reporting which were found
+func (store *MessageStore) RemoveWatchedChannels(jids []string) ([]bool, error) {
+	tx, err := store.db.Begin()
+	if err != nil {
+		return nil, err
+	}
+	stmt, err := tx.Prepare("DELETE FROM watched_channels WHERE jid = ?")
+	if err != nil {
+		tx.Rollback()
+		return nil, err
+	}
+	defer stmt.Close()
+
+	removed := make([]bool, len(jids))
+	for i, jid := range jids {
+		result, err := stmt.Exec(jid)
+		if err != nil {
+			tx.Rollback()
+			return nil, err
+		}
+		rows, err := result.RowsAffected()
+		if err != nil {
+			tx.Rollback()
+			return nil, err
+		}
+		removed[i] = rows > 0
+	}
+	if err := tx.Commit(); err != nil {
+		return nil, err
+	}
+
+	store.watchedMu.Lock()
+	for _, jid := range jids {
+		delete(store.watched, jid)
+	}
+	store.watchedMu.Unlock()
+	return removed, nil
+}
+
+// Pick the stored name for a watched channel, defaulting to the chat name or the JID
+func (store *MessageStore) watchedChannelName(jid, name string) string {
+	if name != "" {
+		return name
+	}
+	var dbName string
+	err := store.db.QueryRow("SELECT name FROM chats WHERE jid = ?", jid).Scan(&dbName)
+	if err == nil && dbName != "" {
+		return dbName
+	}
+	return jid
+}
+
 // Get all watched channels
 func (store *MessageStore) GetWatchedChannels() ([]WatchedChannel, error) {
 	rows, err := store.db.Query("SELECT jid, name, created_at FROM watched_channels ORDER BY created_at DESC")
@@ -621,8 +844,40 @@ func (store *MessageStore) GetWatchedChannels() ([]WatchedChannel, error) {
 	return channels, nil
 }
 
+// Load the watched channel JIDs into memory so IsChannelWatched doesn't query per message
+func (store *MessageStore) loadWatchedChannels() {
+	rows, err := store.db.Query("SELECT jid FROM watched_channels")
+	if err != nil {
+		fmt.Printf("Warning: failed to load watched channels, falling back to database lookups: %v\n", err)
+		return
+	}
+	defer rows.Close()
+
+	watched := make(map[string]struct{})
+	for rows.Next() {
+		var jid string
+		if err := rows.Scan(&jid); err != nil {
+			fmt.Printf("Warning: failed to load watched channels, falling back to database lookups: %v\n", err)
+			return
+		}
+		watched[jid] = struct{}{}
+	}
+
+	store.watchedMu.Lock()
+	store.watched = watched
+	store.watchedMu.Unlock()
+}
+
 // Check if a channel is being watched
 func (store *MessageStore) IsChannelWatched(jid string) bool {
+	store.watchedMu.RLock()
+	if store.watched != nil {
+		_, ok := store.watched[jid]
+		store.watchedMu.RUnlock()
+		return ok
+	}
+	store.watchedMu.RUnlock()
+
 	var count int
 	err := store.db.QueryRow("SELECT COUNT(*) FROM watched_channels WHERE jid = ?", jid).Scan(&count)
 	if err != nil {
@@ -1637,6 +1892,46 @@ func startRESTServer(client *whatsmeow.Client, messageStore *MessageStore, port
 		})
 	})
 
+	// Handler for sending several messages in one request. Messages are sent in order
+	// and each gets its own result, so one failure does not affect the rest.
+	http.HandleFunc("/api/send/batch", func(w http.ResponseWriter, r *http.Request) {
+		// Only allow POST requests
+		if r.Method != http.MethodPost {
+			http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+			return
+		}
+
+		// Parse the request body
+		var req SendBatchRequest
+		if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+			http.Error(w, "Invalid request format", http.StatusBadRequest)
+			return
+		}
+
+		fmt.Println("Received request to send batch of", len(req.Messages), "messages")
+
+		results := make([]SendMessageResponse, 0, len(req.Messages))
+		for _, msg := range req.Messages {
+			if msg.Recipient == "" {
+				results = append(results, SendMessageResponse{Success: false, Message: "Recipient is required"})
+				continue
+			}
+			if msg.Message == "" && msg.MediaPath == "" && msg.MediaURL == "" && msg.MediaData == "" {
+				results = append(results, SendMessageResponse{Success: false, Message: "Message, media_path, media_url, or media_data is required"})
+				continue
+			}
+
+			success, message := sendWhatsAppMessageWithReply(client, msg.Recipient, msg.Message, msg.MediaPath, msg.MediaURL, msg.MediaData, msg.Filename, msg.ReplyToID, msg.ReplyToJID)
+			results = append(results, SendMessageResponse{Success: success, Message: message})
+		}
+
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(map[string]interface{}{
+			"success": true,
+			"results": results,
+		})
+	})
+
 	// Handler for downloading media
 	http.HandleFunc("/api/download", func(w http.ResponseWriter, r *http.Request) {
 		// Only allow POST requests
@@ -1860,9 +2155,32 @@ func startRESTServer(client *whatsmeow.Client, messageStore *MessageStore, port
 			})
 
 		case http.MethodGet:
-			// List scheduled messages
-			status := r.URL.Query().Get("status")
-			messages, err := messageStore.GetScheduledMessages(status)
+			// List scheduled messages, optionally one page at a time
+			// (limit, plus after_time/after_id from the last row of the previous page)
+			query := r.URL.Query()
+			status := query.Get("status")
+			limit, _ := strconv.Atoi(query.Get("limit"))
+			afterID, _ := strconv.ParseInt(query.Get("after_id"), 10, 64)
+			var afterTime time.Time
+			if afterID > 0 {
+				parsed, parseErr := time.Parse(time.RFC3339Nano, query.Get("after_time"))
+				if parseErr != nil {
+					w.WriteHeader(http.StatusBadRequest)
+					json.NewEncoder(w).Encode(map[string]interface{}{
+						"success": false,
+						"message": fmt.Sprintf("Invalid after_time: %v", parseErr),
+					})
+					return
+				}
+				afterTime = parsed
+			}
+
+			// Fetch one extra row to learn whether another page follows
+			fetchLimit := limit
+			if limit > 0 {
+				fetchLimit = limit + 1
+			}
+			messages, err := messageStore.GetScheduledMessages(status, afterTime, afterID, fetchLimit)
 			if err != nil {
 				w.WriteHeader(http.StatusInternalServerError)
 				json.NewEncoder(w).Encode(map[string]interface{}{
@@ -1872,10 +2190,37 @@ func startRESTServer(client *whatsmeow.Client, messageStore *MessageStore, port
 				return
 			}
 
+			hasMore := limit > 0 && len(messages) > limit
+			if hasMore {
+				messages = messages[:limit]
+			}
+
+			// The page's ETag lets a client re-polling an unchanged page get a
+			// bodiless 304 instead of re-decoding the same list
+			page, err := json.Marshal(messages)
+			if err != nil {
+				w.WriteHeader(http.StatusInternalServerError)
+				json.NewEncoder(w).Encode(map[string]interface{}{
+					"success": false,
+					"message": fmt.Sprintf("Failed to encode scheduled messages: %v", err),
+				})
+				return
+			}
+			hash := fnv.New64a()
+			hash.Write(page)
+			etag := fmt.Sprintf("\"%016x-%t\"", hash.Sum64(), hasMore)
+			w.Header().Set("ETag", etag)
+			if r.Header.Get("If-None-Match") == etag {
+				w.WriteHeader(http.StatusNotModified)
+				return
+			}
+
 			json.NewEncoder(w).Encode(map[string]interface{}{
-				"success": true,
-				"data":    messages,
-				"count":   len(messages),
+				"success":  true,
+				"data":     json.RawMessage(page),
+				"count":    len(messages),
+				"has_more": hasMore,
+				"etag":     etag,
 			})
 
 		case http.MethodDelete:
@@ -2274,16 +2619,7 @@ func startRESTServer(client *whatsmeow.Client, messageStore *MessageStore, port
 			}
 
 			// If no name provided, try to get it from the database
-			name := req.Name
-			if name == "" {
-				var dbName string
-				err := messageStore.db.QueryRow("SELECT name FROM chats WHERE jid = ?", req.JID).Scan(&dbName)
-				if err == nil && dbName != "" {
-					name = dbName
-				} else {
-					name = req.JID
-				}
-			}
+			name := messageStore.watchedChannelName(req.JID, req.Name)
 
 			err := messageStore.AddWatchedChannel(req.JID, name)
 			if err != nil {
@@ -2358,6 +2694,118 @@ func startRESTServer(client *whatsmeow.Client, messageStore *MessageStore, port
 		}
 	})
 
+	// Handler for watching or unwatching several channels in one request
+	http.HandleFunc("/api/watch/batch", func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+
+		type watchResult struct {
+			Success bool   `json:"success"`
+			Message string `json:"message"`
+			JID     string `json:"jid"`
+		}
+
+		// Top-level success is true only when every item succeeded; per-item outcomes are
+		// always in results, so callers can tell which JIDs failed
+		writeResults := func(results []watchResult, action string) {
+			succeeded := 0
+			for _, res := range results {
+				if res.Success {
+					succeeded++
+				}
+			}
+			json.NewEncoder(w).Encode(map[string]interface{}{
+				"success": succeeded == len(results),
+				"message": fmt.Sprintf("%s %d of %d channels", action, succeeded, len(results)),
+				"results": results,
+			})
+		}
+
+		switch r.Method {
+		case http.MethodPost:
+			var req struct {
+				Channels []struct {
+					JID  string `json:"jid"`
+					Name string `json:"name"`
+				} `json:"channels"`
+			}
+			if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+				w.WriteHeader(http.StatusBadRequest)
+				json.NewEncoder(w).Encode(map[string]interface{}{
+					"success": false,
+					"message": "Invalid request format",
+				})
+				return
+			}
+
+			results := make([]watchResult, len(req.Channels))
+			var jids, names []string
+			var pending []int
+			for i, ch := range req.Channels {
+				results[i].JID = ch.JID
+				if ch.JID == "" {
+					results[i].Message = "JID is required"
+					continue
+				}
+				name := messageStore.watchedChannelName(ch.JID, ch.Name)
+				jids = append(jids, ch.JID)
+				names = append(names, name)
+				pending = append(pending, i)
+				results[i].Message = fmt.Sprintf("Now watching channel: %s", name)
+			}
+
+			if len(jids) > 0 {
+				if err := messageStore.AddWatchedChannels(jids, names); err != nil {
+					for _, i := range pending {
+						results[i].Message = fmt.Sprintf("Failed to add watched channel: %v", err)
+					}
+				} else {
+					for _, i := range pending {
+						results[i].Success = true
+					}
+				}
+			}
+
+			writeResults(results, "Watched")
+
+		case http.MethodDelete:
+			var req struct {
+				JIDs []string `json:"jids"`
+			}
+			if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+				w.WriteHeader(http.StatusBadRequest)
+				json.NewEncoder(w).Encode(map[string]interface{}{
+					"success": false,
+					"message": "Invalid request format",
+				})
+				return
+			}
+
+			results := make([]watchResult, len(req.JIDs))
+			removed, err := messageStore.RemoveWatchedChannels(req.JIDs)
+			for i, jid := range req.JIDs {
+				results[i].JID = jid
+				switch {
+				case err != nil:
+					results[i].Message = fmt.Sprintf("Failed to remove watched channel: %v", err)
+				case removed[i]:
+					results[i].Success = true
+					results[i].Message = "Channel removed from watch list"
+				default:
+					results[i].Message = "channel not found in watch list"
+				}
+			}
+
+			writeResults(results, "Unwatched")
+
+		default:
+			w.WriteHeader(http.StatusMethodNotAllowed)
+			json.NewEncoder(w).Encode(map[string]interface{}{
+				"success": false,
+				"message": "Method not allowed",
+			})
+		}
+	})
+
 	// Handler for getting group info (including members)
 	http.HandleFunc("/api/group", func(w http.ResponseWriter, r *http.Request) {
 		w.Header().Set("Content-Type", "application/json")
@@ -1,6 +1,53 @@
+import hashlib
 import os
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+# Converted audio is written to tmpfs when there is one, so the bridge (which runs
+# alongside this server and reads media_path itself) reads it from memory, not disk
+_TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else tempfile.gettempdir()
+
+# Converted files live in a content-addressed directory so re-sending the same
+# audio, even from another path or after a restart, skips ffmpeg entirely
+_AUDIO_CACHE_DIR = os.path.join(_TEMP_DIR, "wa_audio_cache")
+_AUDIO_CACHE_MAX_FILES = 128
+
+# Files written or handed out this recently are never pruned, since a send may
+# still be uploading them; the cache can briefly exceed _AUDIO_CACHE_MAX_FILES
+_AUDIO_CACHE_GRACE_SECONDS = 10 * 60
+
+# Cache file for each (real path, mtime, size, bitrate, sample rate), so files
+# seen before in this process are not even re-hashed
+_converted_cache = OrderedDict()
+_converted_cache_lock = threading.Lock()
+
+# When this process last returned each cache file, so reused files count as in use
+_audio_cache_returned = {}
+
+def is_opus_ogg(input_file):
+    """
+    Check whether a file is already Opus audio in an Ogg container.
+    
+    Only the first Ogg page is read: it must start with the "OggS" capture pattern
+    and carry the "OpusHead" identification header, which for Opus streams is the
+    first packet. Files that can't be read are reported as not Opus.
+    
+    Args:
+        input_file (str): Path to the audio file
+    
+    Returns:
+        bool: True if the file can be sent as a voice message without conversion
+    """
+    try:
+        with open(input_file, "rb") as f:
+            head = f.read(64)
+    except OSError:
+        return False
+    return head.startswith(b"OggS") and b"OpusHead" in head
+
 
 def convert_to_opus_ogg(input_file, output_file=None, bitrate="32k", sample_rate=24000):
     """
@@ -43,6 +90,7 @@ def convert_to_opus_ogg(input_file, output_file=None, bitrate="32k", sample_rate
         "-vbr", "on",           # Variable bitrate
         "-compression_level", "10",  # Maximum compression
         "-frame_duration", "60",     # 60ms frames (good for voice)
+        "-f", "ogg",                 # Don't infer the container from the name (e.g. .ogg.part)
         "-y",                        # Overwrite output file if it exists
         output_file
     ]
@@ -78,7 +126,7 @@ def convert_to_opus_ogg_temp(input_file, bitrate="32k", sample_rate=24000):
         RuntimeError: If the ffmpeg conversion fails
     """
     # Create a temporary file with .ogg extension
-    temp_file = tempfile.NamedTemporaryFile(suffix=".ogg", delete=False)
+    temp_file = tempfile.NamedTemporaryFile(suffix=".ogg", dir=_TEMP_DIR, delete=False)
     temp_file.close()
     
     try:
@@ -92,6 +140,109 @@ def convert_to_opus_ogg_temp(input_file, bitrate="32k", sample_rate=24000):
         raise e
 
 
+def _prune_audio_cache():
+    """Delete the least recently used files once the cache holds too many.
+
+    A file's last use is when it was written or last returned by this process.
+    Files used within _AUDIO_CACHE_GRACE_SECONDS are kept even over the limit.
+    """
+    try:
+        entries = [entry for entry in os.scandir(_AUDIO_CACHE_DIR) if entry.name.endswith(".ogg")]
+    except OSError:
+        return
+    if len(entries) <= _AUDIO_CACHE_MAX_FILES:
+        return
+    with _converted_cache_lock:
+        last_used = {
+            entry.path: max(entry.stat().st_mtime, _audio_cache_returned.get(entry.path, 0))
+            for entry in entries
+        }
+    cutoff = time.time() - _AUDIO_CACHE_GRACE_SECONDS
+    entries.sort(key=lambda entry: last_used[entry.path])
+    for entry in entries[:len(entries) - _AUDIO_CACHE_MAX_FILES]:
+        if last_used[entry.path] > cutoff:
+            break
+        with _converted_cache_lock:
+            # Re-check under the lock in case the file was handed out since the scan
+            if _audio_cache_returned.get(entry.path, 0) > cutoff:
+                continue
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+            _audio_cache_returned.pop(entry.path, None)
+
+
+def convert_to_opus_ogg_cached(input_file, bitrate="32k", sample_rate=24000, input_stat=None):
+    """
+    Convert an audio file to Opus format in an Ogg container, reusing earlier conversions.
+    
+    Conversions are stored under _AUDIO_CACHE_DIR, named by the SHA-256 of the input
+    and the encoding settings, and written atomically so concurrent senders never see
+    a partial file. Only the _AUDIO_CACHE_MAX_FILES most recently used conversions are
+    kept, plus any used within _AUDIO_CACHE_GRACE_SECONDS, so a returned file is not
+    deleted while it is still being sent.
+    
+    Args:
+        input_file (str): Path to the input audio file
+        bitrate (str, optional): Target bitrate for Opus encoding (default: "32k")
+        sample_rate (int, optional): Sample rate for output (default: 24000)
+        input_stat (os.stat_result, optional): os.stat() of input_file, if the caller already has it
+    
+    Returns:
+        str: Path to the cached file with the converted audio
+        
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        RuntimeError: If the ffmpeg conversion fails
+    """
+    stat = input_stat
+    if stat is None:
+        try:
+            stat = os.stat(input_file)
+        except OSError:
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+    key = (os.path.realpath(input_file), stat.st_mtime_ns, stat.st_size, bitrate, sample_rate)
+    
+    with _converted_cache_lock:
+        cached = _converted_cache.get(key)
+        if cached is not None:
+            if os.path.isfile(cached):
+                _converted_cache.move_to_end(key)
+                _audio_cache_returned[cached] = time.time()
+                return cached
+            del _converted_cache[key]
+    
+    with open(input_file, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    output_file = os.path.join(_AUDIO_CACHE_DIR, f"{digest}-{bitrate}-{sample_rate}.ogg")
+    
+    with _converted_cache_lock:
+        # Mark the file in use before pruning can see it, whether it is reused or converted
+        _audio_cache_returned[output_file] = time.time()
+
+    if not os.path.isfile(output_file):
+        os.makedirs(_AUDIO_CACHE_DIR, exist_ok=True)
+        # Convert next to the final name, then rename into place atomically
+        fd, partial_file = tempfile.mkstemp(suffix=".ogg.part", dir=_AUDIO_CACHE_DIR)
+        os.close(fd)
+        try:
+            convert_to_opus_ogg(input_file, partial_file, bitrate, sample_rate)
+            os.replace(partial_file, output_file)
+        except Exception:
+            if os.path.exists(partial_file):
+                os.unlink(partial_file)
+            raise
+        _prune_audio_cache()
+    
+    with _converted_cache_lock:
+        _converted_cache[key] = output_file
+        _converted_cache.move_to_end(key)
+        while len(_converted_cache) > _AUDIO_CACHE_MAX_FILES:
+            _converted_cache.popitem(last=False)
+    return output_file
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
@@ -1,16 +1,25 @@
+import asyncio
+import functools
+import re
+import uuid
 from typing import List, Dict, Any, Optional
-from mcp.server.fastmcp import FastMCP
+import threading
+from mcp.server.fastmcp import FastMCP, Context
+from cache import TTLCache
+from send_queue import SendQueue
 from whatsapp import (
     search_contacts as whatsapp_search_contacts,
     list_messages as whatsapp_list_messages,
+    iter_messages as whatsapp_iter_messages,
+    format_messages_list as whatsapp_format_messages_list,
     list_chats as whatsapp_list_chats,
     get_chat as whatsapp_get_chat,
     get_direct_chat_by_contact as whatsapp_get_direct_chat_by_contact,
     get_contact_chats as whatsapp_get_contact_chats,
     get_last_interaction as whatsapp_get_last_interaction,
     get_message_context as whatsapp_get_message_context,
-    send_message as whatsapp_send_message,
-    send_reply as whatsapp_send_reply,
+    build_send_payload as whatsapp_build_send_payload,
+    send_batch as whatsapp_send_batch,
     send_file as whatsapp_send_file,
     send_audio_message as whatsapp_audio_voice_message,
     download_media as whatsapp_download_media,
@@ -19,40 +28,164 @@ from whatsapp import (
     cancel_scheduled_message as whatsapp_cancel_scheduled_message,
     watch_channel as whatsapp_watch_channel,
     unwatch_channel as whatsapp_unwatch_channel,
+    watch_channels as whatsapp_watch_channels,
+    unwatch_channels as whatsapp_unwatch_channels,
     list_watched_channels as whatsapp_list_watched_channels,
     archive_chat as whatsapp_archive_chat,
     resync_app_state as whatsapp_resync_app_state,
     get_group_info as whatsapp_get_group_info,
     add_group_members as whatsapp_add_group_members,
-    remove_group_members as whatsapp_remove_group_members
+    remove_group_members as whatsapp_remove_group_members,
+    warm_bridge_connection as whatsapp_warm_bridge_connection
 )
 
 # Initialize FastMCP server
+# Tools are async so slow tools never block the event loop; the blocking
+# SQLite and bridge HTTP calls in the whatsapp module run via asyncio.to_thread.
 mcp = FastMCP("whatsapp")
 
+# Phone number with country code (digits only), or a user, group, LID or newsletter JID.
+# Rejects malformed recipients before they cost a bridge round trip; use fullmatch,
+# since match would also accept a trailing newline. Tools that only remove or
+# change existing chats (unwatch, archive) leave validation to the bridge, which
+# also knows broadcast JIDs such as status@broadcast.
+_JID_RE = re.compile(r'\d{7,15}|\d{7,15}(?::\d+)?@s\.whatsapp\.net|\d+(?:-\d+)?@g\.us|\d+@lid|\d+@newsletter')
+
+def _reply(success: bool, message: str) -> Dict[str, Any]:
+    """Build the standard {success, message} tool response."""
+    return {"success": success, "message": message}
+
+# Fixed validation errors, shared rather than rebuilt on every call.
+# Safe to return by reference: FastMCP serializes tool results straight away.
+_ERR_NO_RECIPIENT = _reply(False, "Recipient must be provided")
+_ERR_NO_JID = _reply(False, "JID must be provided")
+_ERR_NO_GROUP_JID = _reply(False, "group_jid must be provided")
+_ERR_NOT_GROUP_JID = _reply(False, "group_jid must be a group JID (ending with @g.us)")
+_ERR_NO_PARTICIPANT = _reply(False, "participant must be provided")
+
+# Results of read-only tools, keyed by (tool name, arguments)
+_tool_cache = TTLCache(maxsize=1024, ttl=30)
+
+def cached_tool(ttl: float = 30):
+    """Cache a read-only tool's result for ttl seconds, keyed on its arguments.
+
+    Messages arriving through the bridge do not invalidate entries, so keep
+    ttl short for tools whose results change as new messages come in. Failures
+    are never cached: None, {"success": False, ...} results and exceptions
+    (the whatsapp module raises sqlite3.Error rather than returning empty
+    results) all go straight back to the caller.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return await fn(*args, **kwargs)
+            result = _tool_cache.get(key)
+            if result is None:
+                result = await fn(*args, **kwargs)
+                if result is not None and not (isinstance(result, dict) and result.get("success") is False):
+                    _tool_cache.set(key, result, ttl)
+            return result
+        return wrapper
+    return decorator
+
+def invalidate_cache(jid: Optional[str] = None, tools: tuple = ()) -> None:
+    """Drop cached results for the named tools and any call whose arguments mention jid."""
+    # Compare on the user part so a phone number also matches its full JID
+    user = jid.split('@')[0] if jid else None
+
+    def matches(key):
+        if key[0] in tools:
+            return True
+        if not user:
+            return False
+        values = list(key[1]) + [value for _, value in key[2]]
+        return any(isinstance(value, str) and user in value for value in values)
+
+    _tool_cache.invalidate(matches)
+
+# Text sends from concurrent tool calls are coalesced into batched bridge requests
+_send_queue = SendQueue(whatsapp_send_batch)
+
+# Tools whose results change whenever a message is sent to any chat
+_CHAT_LIST_TOOLS = ("list_chats",)
+
+# Tools that show contact or chat names, which an app state resync can rewrite
+_CHAT_NAME_TOOLS = ("search_contacts", "list_chats", "get_chat", "get_direct_chat_by_contact", "get_contact_chats")
+
+# How send tools acknowledge: wait for the bridge ("sync"), return at once without
+# tracking the outcome ("fire"), or return at once and record it for get_send_status ("eventual")
+_ACK_MODES = ("sync", "fire", "eventual")
+
+# Outcomes of "eventual" sends by send_id; the oldest are dropped past maxsize
+_send_status = TTLCache(maxsize=10000, ttl=24 * 60 * 60)
+
+# Strong references to in-flight background sends so they are not garbage collected
+_background_sends = set()
+
+async def _queue_send(payload: dict, recipient: str, ack: str) -> Dict[str, Any]:
+    """Submit a send payload to the send queue and acknowledge it according to ack."""
+    if ack not in _ACK_MODES:
+        return _reply(False, f"Invalid ack: {ack}. Use one of: {', '.join(_ACK_MODES)}")
+
+    async def deliver():
+        success, status_message = await _send_queue.submit(payload)
+        if success:
+            invalidate_cache(recipient, _CHAT_LIST_TOOLS)
+        return success, status_message
+
+    if ack == "sync":
+        return _reply(*await deliver())
+
+    if ack == "fire":
+        # Nothing is recorded, so there is no send_id to look up later
+        task = asyncio.create_task(deliver())
+        _background_sends.add(task)
+        task.add_done_callback(_background_sends.discard)
+        return _reply(True, "Queued")
+
+    send_id = uuid.uuid4().hex
+    _send_status.set(send_id, {"status": "pending", "message": "Queued"})
+
+    async def deliver_in_background():
+        success, status_message = await deliver()
+        _send_status.set(send_id, {"status": "sent" if success else "failed", "message": status_message})
+
+    task = asyncio.create_task(deliver_in_background())
+    _background_sends.add(task)
+    task.add_done_callback(_background_sends.discard)
+
+    result = _reply(True, "Queued")
+    result["send_id"] = send_id
+    return result
+
 @mcp.tool()
-def search_contacts(query: str) -> List[Dict[str, Any]]:
+@cached_tool(ttl=60)
+async def search_contacts(query: str) -> List[Dict[str, Any]]:
     """Search WhatsApp contacts by name or phone number.
     
     Args:
         query: Search term to match against contact names or phone numbers
     """
-    contacts = whatsapp_search_contacts(query)
+    contacts = await asyncio.to_thread(whatsapp_search_contacts, query)
     return contacts
 
 @mcp.tool()
-def list_messages(
+async def list_messages(
     after: Optional[str] = None,
     before: Optional[str] = None,
     sender_phone_number: Optional[str] = None,
     chat_jid: Optional[str] = None,
     query: Optional[str] = None,
     limit: int = 20,
-    page: int = 0,
+    cursor: Optional[str] = None,
     include_context: bool = True,
     context_before: int = 1,
     context_after: int = 1
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """Get WhatsApp messages matching specified criteria with optional context.
     
     Args:
@@ -60,101 +193,206 @@ def list_messages(
         before: Optional ISO-8601 formatted string to only return messages before this date
         sender_phone_number: Optional phone number to filter messages by sender
         chat_jid: Optional chat JID to filter messages by chat
-        query: Optional search term to filter messages by content
+        query: Optional full-text search over message content and media filenames. Plain words match as prefixes (meet finds meeting); FTS5 syntax is also supported: phrases ("see you soon"), prefix terms (meet*) and AND/OR/NOT
         limit: Maximum number of messages to return (default 20)
-        page: Page number for pagination (default 0)
+        cursor: Pass the next_cursor from a previous call to fetch the next page (default None for the first page)
         include_context: Whether to include messages before and after matches (default True)
         context_before: Number of messages to include before each match (default 1)
         context_after: Number of messages to include after each match (default 1)
+
+    Returns:
+        A dictionary with the formatted messages and next_cursor (None when there are no more pages)
     """
-    messages = whatsapp_list_messages(
+    messages, next_cursor = await asyncio.to_thread(
+        whatsapp_list_messages,
         after=after,
         before=before,
         sender_phone_number=sender_phone_number,
         chat_jid=chat_jid,
         query=query,
         limit=limit,
-        page=page,
+        cursor=cursor,
         include_context=include_context,
         context_before=context_before,
         context_after=context_after
     )
-    return messages
+    return {
+        "messages": messages,
+        "next_cursor": next_cursor
+    }
 
 @mcp.tool()
-def list_chats(
+async def stream_messages(
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    sender_phone_number: Optional[str] = None,
+    chat_jid: Optional[str] = None,
+    query: Optional[str] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Export a large range of WhatsApp messages without context, newest first.
+
+    Messages are read from the database in batches of 256 and formatted as they
+    arrive, reporting progress after each batch. The formatted text is returned
+    in one piece once every batch is read, so page through large ranges with
+    limit and next_cursor. Use this instead of list_messages when fetching
+    hundreds or thousands of messages.
+
+    Args:
+        after: Optional ISO-8601 formatted string to only return messages after this date
+        before: Optional ISO-8601 formatted string to only return messages before this date
+        sender_phone_number: Optional phone number to filter messages by sender
+        chat_jid: Optional chat JID to filter messages by chat
+        query: Optional full-text search over message content and media filenames (plain words or FTS5 syntax)
+        limit: Maximum number of messages to return (default 1000)
+        cursor: Pass the next_cursor from a previous call to continue where it stopped (default None)
+
+    Returns:
+        A dictionary with the formatted messages, count, and next_cursor (None when there are no more messages)
+    """
+    batches = whatsapp_iter_messages(
+        after=after,
+        before=before,
+        sender_phone_number=sender_phone_number,
+        chat_jid=chat_jid,
+        query=query,
+        limit=limit,
+        cursor=cursor
+    )
+    # The generator holds a pooled connection; only one thread may drive it at a time
+    lock = threading.Lock()
+
+    def next_chunk():
+        with lock:
+            batch = next(batches, None)
+            if batch is None:
+                return None
+            messages, batch_cursor = batch
+            return len(messages), batch_cursor, whatsapp_format_messages_list(messages)
+
+    def close_batches():
+        with lock:
+            batches.close()
+
+    chunks = []
+    count = 0
+    last_cursor = None
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next_chunk)
+            if chunk is None:
+                break
+            size, last_cursor, text = chunk
+            count += size
+            chunks.append(text)
+            if ctx is not None:
+                await ctx.report_progress(count, limit)
+    finally:
+        # Runs on cancellation too, releasing the SQLite statement and connection
+        # before the call returns; waits for a batch still being read, if any
+        await asyncio.to_thread(close_batches)
+
+    return {
+        "messages": "".join(chunks) if chunks else "No messages to display.",
+        "count": count,
+        "next_cursor": last_cursor if count == limit else None
+    }
+
+@mcp.tool()
+@cached_tool(ttl=10)
+async def list_chats(
     query: Optional[str] = None,
     limit: int = 20,
-    page: int = 0,
+    cursor: Optional[str] = None,
     include_last_message: bool = True,
     sort_by: str = "last_active",
     archived: Optional[bool] = None
-) -> List[Dict[str, Any]]:
+) -> Dict[str, Any]:
     """Get WhatsApp chats matching specified criteria.
 
     Args:
         query: Optional search term to filter chats by name or JID
         limit: Maximum number of chats to return (default 20)
-        page: Page number for pagination (default 0)
+        cursor: Pass the next_cursor from a previous call to fetch the next page (default None for the first page)
         include_last_message: Whether to include the last message in each chat (default True)
         sort_by: Field to sort results by, either "last_active" or "name" (default "last_active")
         archived: Optional filter for archived status. None returns all chats (default), True returns only archived chats, False returns only unarchived chats (inbox)
+
+    Returns:
+        A dictionary with the list of chats and next_cursor (None when there are no more pages)
     """
-    chats = whatsapp_list_chats(
+    chats, next_cursor = await asyncio.to_thread(
+        whatsapp_list_chats,
         query=query,
         limit=limit,
-        page=page,
+        cursor=cursor,
         include_last_message=include_last_message,
         sort_by=sort_by,
         archived=archived
     )
-    return chats
+    return {
+        "chats": chats,
+        "next_cursor": next_cursor
+    }
 
 @mcp.tool()
-def get_chat(chat_jid: str, include_last_message: bool = True) -> Dict[str, Any]:
+@cached_tool(ttl=10)
+async def get_chat(chat_jid: str, include_last_message: bool = True) -> Dict[str, Any]:
     """Get WhatsApp chat metadata by JID.
     
     Args:
         chat_jid: The JID of the chat to retrieve
         include_last_message: Whether to include the last message (default True)
     """
-    chat = whatsapp_get_chat(chat_jid, include_last_message)
+    chat = await asyncio.to_thread(whatsapp_get_chat, chat_jid, include_last_message)
     return chat
 
 @mcp.tool()
-def get_direct_chat_by_contact(sender_phone_number: str) -> Dict[str, Any]:
+@cached_tool(ttl=10)
+async def get_direct_chat_by_contact(sender_phone_number: str) -> Dict[str, Any]:
     """Get WhatsApp chat metadata by sender phone number.
     
     Args:
         sender_phone_number: The phone number to search for
     """
-    chat = whatsapp_get_direct_chat_by_contact(sender_phone_number)
+    chat = await asyncio.to_thread(whatsapp_get_direct_chat_by_contact, sender_phone_number)
     return chat
 
 @mcp.tool()
-def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> List[Dict[str, Any]]:
+@cached_tool(ttl=10)
+async def get_contact_chats(jid: str, limit: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
     """Get all WhatsApp chats involving the contact.
     
     Args:
         jid: The contact's JID to search for
         limit: Maximum number of chats to return (default 20)
-        page: Page number for pagination (default 0)
+        cursor: Pass the next_cursor from a previous call to fetch the next page (default None for the first page)
+
+    Returns:
+        A dictionary with the list of chats and next_cursor (None when there are no more pages)
     """
-    chats = whatsapp_get_contact_chats(jid, limit, page)
-    return chats
+    chats, next_cursor = await asyncio.to_thread(whatsapp_get_contact_chats, jid, limit, cursor)
+    return {
+        "chats": chats,
+        "next_cursor": next_cursor
+    }
 
 @mcp.tool()
-def get_last_interaction(jid: str) -> str:
+@cached_tool(ttl=10)
+async def get_last_interaction(jid: str) -> Optional[str]:
     """Get most recent WhatsApp message involving the contact.
     
     Args:
         jid: The JID of the contact to search for
     """
-    message = whatsapp_get_last_interaction(jid)
+    message = await asyncio.to_thread(whatsapp_get_last_interaction, jid)
     return message
 
 @mcp.tool()
-def get_message_context(
+@cached_tool(ttl=30)
+async def get_message_context(
     message_id: str,
     before: int = 5,
     after: int = 5
@@ -166,13 +404,14 @@ def get_message_context(
         before: Number of messages to include before the target message (default 5)
         after: Number of messages to include after the target message (default 5)
     """
-    context = whatsapp_get_message_context(message_id, before, after)
+    context = await asyncio.to_thread(whatsapp_get_message_context, message_id, before, after)
     return context
 
 @mcp.tool()
-def send_message(
+async def send_message(
     recipient: str,
-    message: str
+    message: str,
+    ack: str = "sync"
 ) -> Dict[str, Any]:
     """Send a WhatsApp message to a person or group. For group chats use the JID.
 
@@ -180,30 +419,30 @@ def send_message(
         recipient: The recipient - either a phone number with country code but no + or other symbols,
                  or a JID (e.g., "123456789@s.whatsapp.net" or a group JID like "123456789@g.us")
         message: The message text to send
+        ack: "sync" to wait for the send to complete (default), "fire" to return immediately
+             without tracking the outcome, or "eventual" to return immediately with a send_id
+             whose outcome can be checked later with get_send_status
     
     Returns:
-        A dictionary containing success status and a status message
+        A dictionary containing success status and a status message, plus a send_id when ack is "eventual"
     """
     # Validate input
     if not recipient:
-        return {
-            "success": False,
-            "message": "Recipient must be provided"
-        }
+        return _ERR_NO_RECIPIENT
+
+    if not _JID_RE.fullmatch(recipient):
+        return _reply(False, f"Invalid recipient: {recipient}. Use a phone number with country code (digits only) or a JID")
     
-    # Call the whatsapp_send_message function with the unified recipient parameter
-    success, status_message = whatsapp_send_message(recipient, message)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    # Queue the message; concurrent sends are batched into one bridge request
+    return await _queue_send(whatsapp_build_send_payload(recipient, message), recipient, ack)
 
 @mcp.tool()
-def send_reply(
+async def send_reply(
     recipient: str,
     message: str,
     reply_to_id: str,
-    reply_to_jid: str
+    reply_to_jid: str,
+    ack: str = "sync"
 ) -> Dict[str, Any]:
     """Send a WhatsApp message as a reply to a specific message.
 
@@ -214,32 +453,45 @@ def send_reply(
         reply_to_id: The ID of the message being replied to (from the message's 'id' field)
         reply_to_jid: The JID of the sender of the message being replied to (from the message's 'sender' field,
                      should be in format "123456789@s.whatsapp.net")
+        ack: "sync" to wait for the send to complete (default), "fire" to return immediately
+             without tracking the outcome, or "eventual" to return immediately with a send_id
+             whose outcome can be checked later with get_send_status
 
     Returns:
-        A dictionary containing success status and a status message
+        A dictionary containing success status and a status message, plus a send_id when ack is "eventual"
     """
     # Validate input
     if not recipient:
-        return {
-            "success": False,
-            "message": "Recipient must be provided"
-        }
+        return _ERR_NO_RECIPIENT
+
+    if not _JID_RE.fullmatch(recipient):
+        return _reply(False, f"Invalid recipient: {recipient}. Use a phone number with country code (digits only) or a JID")
 
     if not reply_to_id:
-        return {
-            "success": False,
-            "message": "reply_to_id must be provided"
-        }
+        return _reply(False, "reply_to_id must be provided")
 
-    # Call the whatsapp_send_reply function
-    success, status_message = whatsapp_send_reply(recipient, message, reply_to_id, reply_to_jid)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    # Queue the reply; concurrent sends are batched into one bridge request
+    return await _queue_send(
+        whatsapp_build_send_payload(recipient, message, reply_to_id, reply_to_jid), recipient, ack
+    )
 
 @mcp.tool()
-def send_file(recipient: str, media_path: str = "", media_data: str = "", filename: str = "") -> Dict[str, Any]:
+async def get_send_status(send_id: str) -> Dict[str, Any]:
+    """Get the outcome of a message sent with ack="eventual".
+
+    Args:
+        send_id: The send_id returned by send_message or send_reply
+
+    Returns:
+        A dictionary containing success, status ("pending", "sent" or "failed") and the status message
+    """
+    status = _send_status.get(send_id)
+    if status is None:
+        return _reply(False, f"Unknown send_id: {send_id}. Only the most recent sends made with ack=\"eventual\" are kept")
+    return {"success": True, "send_id": send_id, **status}
+
+@mcp.tool()
+async def send_file(recipient: str, media_path: str = "", media_data: str = "", filename: str = "") -> Dict[str, Any]:
     """Send a file such as a picture, raw audio, video or document via WhatsApp to the specified recipient. For group messages use the JID.
 
     Supports multiple ways to provide the file:
@@ -257,16 +509,20 @@ def send_file(recipient: str, media_path: str = "", media_data: str = "", filena
     Returns:
         A dictionary containing success status and a status message
     """
+    if not recipient:
+        return _ERR_NO_RECIPIENT
+
+    if not _JID_RE.fullmatch(recipient):
+        return _reply(False, f"Invalid recipient: {recipient}. Use a phone number with country code (digits only) or a JID")
 
     # Call the whatsapp_send_file function
-    success, status_message = whatsapp_send_file(recipient, media_path, media_data, filename)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    success, status_message = await asyncio.to_thread(whatsapp_send_file, recipient, media_path, media_data, filename)
+    if success:
+        invalidate_cache(recipient, _CHAT_LIST_TOOLS)
+    return _reply(success, status_message)
 
 @mcp.tool()
-def send_audio_message(recipient: str, media_path: str) -> Dict[str, Any]:
+async def send_audio_message(recipient: str, media_path: str) -> Dict[str, Any]:
     """Send any audio file as a WhatsApp audio message to the specified recipient. For group messages use the JID. If it errors due to ffmpeg not being installed, use send_file instead.
 
     Supports both local file paths and remote URLs:
@@ -281,14 +537,19 @@ def send_audio_message(recipient: str, media_path: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing success status and a status message
     """
-    success, status_message = whatsapp_audio_voice_message(recipient, media_path)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    if not recipient:
+        return _ERR_NO_RECIPIENT
+
+    if not _JID_RE.fullmatch(recipient):
+        return _reply(False, f"Invalid recipient: {recipient}. Use a phone number with country code (digits only) or a JID")
+
+    success, status_message = await asyncio.to_thread(whatsapp_audio_voice_message, recipient, media_path)
+    if success:
+        invalidate_cache(recipient, _CHAT_LIST_TOOLS)
+    return _reply(success, status_message)
 
 @mcp.tool()
-def download_media(message_id: str, chat_jid: str) -> Dict[str, Any]:
+async def download_media(message_id: str, chat_jid: str) -> Dict[str, Any]:
     """Download media from a WhatsApp message and get the local file path.
 
     Args:
@@ -298,11 +559,11 @@ def download_media(message_id: str, chat_jid: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing success status, a status message, and the file path if successful
     """
-    result = whatsapp_download_media(message_id, chat_jid)
+    result = await asyncio.to_thread(whatsapp_download_media, message_id, chat_jid)
     return result
 
 @mcp.tool()
-def schedule_message(
+async def schedule_message(
     recipient: str,
     message: str,
     scheduled_time: str,
@@ -321,49 +582,54 @@ def schedule_message(
         A dictionary containing success status, a status message, and the scheduled message ID
     """
     if not recipient:
-        return {
-            "success": False,
-            "message": "Recipient must be provided"
-        }
+        return _ERR_NO_RECIPIENT
+
+    if not _JID_RE.fullmatch(recipient):
+        return _reply(False, f"Invalid recipient: {recipient}. Use a phone number with country code (digits only) or a JID")
 
     if not message and not media_path:
-        return {
-            "success": False,
-            "message": "Message or media_path must be provided"
-        }
+        return _reply(False, "Message or media_path must be provided")
 
-    success, status_message, message_id = whatsapp_schedule_message(
-        recipient, message, scheduled_time, media_path
+    success, status_message, message_id = await asyncio.to_thread(
+        whatsapp_schedule_message, recipient, message, scheduled_time, media_path
     )
 
-    result = {
-        "success": success,
-        "message": status_message
-    }
+    result = _reply(success, status_message)
     if message_id:
         result["scheduled_message_id"] = message_id
 
     return result
 
 @mcp.tool()
-def list_scheduled_messages(status: Optional[str] = None) -> Dict[str, Any]:
-    """List all scheduled WhatsApp messages.
+async def list_scheduled_messages(
+    status: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """List scheduled WhatsApp messages, one page at a time ordered by scheduled time.
 
     Args:
         status: Optional filter by status - "pending", "sent", or "failed"
+        limit: Maximum number of messages to return (default 50)
+        cursor: Pass the next_cursor from a previous call to fetch the next page (default None for the first page)
 
     Returns:
-        A dictionary containing the list of scheduled messages and count
+        A dictionary containing the page of scheduled messages, count_on_page, has_more and next_cursor
     """
-    messages = whatsapp_list_scheduled_messages(status)
+    page = await asyncio.to_thread(whatsapp_list_scheduled_messages, status, limit, cursor)
+    if page is None:
+        return _reply(False, "Failed to fetch scheduled messages from the bridge")
+    messages, next_cursor, has_more = page
     return {
         "success": True,
         "messages": messages,
-        "count": len(messages)
+        "count_on_page": len(messages),
+        "has_more": has_more,
+        "next_cursor": next_cursor
     }
 
 @mcp.tool()
-def cancel_scheduled_message(message_id: int) -> Dict[str, Any]:
+async def cancel_scheduled_message(message_id: int) -> Dict[str, Any]:
     """Cancel a pending scheduled WhatsApp message.
 
     Args:
@@ -372,14 +638,11 @@ def cancel_scheduled_message(message_id: int) -> Dict[str, Any]:
     Returns:
         A dictionary containing success status and a status message
     """
-    success, status_message = whatsapp_cancel_scheduled_message(message_id)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    success, status_message = await asyncio.to_thread(whatsapp_cancel_scheduled_message, message_id)
+    return _reply(success, status_message)
 
 @mcp.tool()
-def watch_channel(jid: str, name: Optional[str] = None) -> Dict[str, Any]:
+async def watch_channel(jid: str, name: Optional[str] = None) -> Dict[str, Any]:
     """Add a WhatsApp channel/chat to the watch list. Messages from watched channels trigger webhooks to the configured WHATSAPP_WEBHOOK_URL.
 
     Args:
@@ -390,19 +653,18 @@ def watch_channel(jid: str, name: Optional[str] = None) -> Dict[str, Any]:
         A dictionary containing success status and a status message
     """
     if not jid:
-        return {
-            "success": False,
-            "message": "JID must be provided"
-        }
+        return _ERR_NO_JID
 
-    success, status_message = whatsapp_watch_channel(jid, name)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    if not _JID_RE.fullmatch(jid):
+        return _reply(False, f"Invalid JID: {jid}")
+
+    success, status_message = await asyncio.to_thread(whatsapp_watch_channel, jid, name)
+    if success:
+        invalidate_cache(jid, ("list_watched_channels",))
+    return _reply(success, status_message)
 
 @mcp.tool()
-def unwatch_channel(jid: str) -> Dict[str, Any]:
+async def unwatch_channel(jid: str) -> Dict[str, Any]:
     """Remove a WhatsApp channel/chat from the watch list.
 
     Args:
@@ -412,34 +674,75 @@ def unwatch_channel(jid: str) -> Dict[str, Any]:
         A dictionary containing success status and a status message
     """
     if not jid:
-        return {
-            "success": False,
-            "message": "JID must be provided"
-        }
+        return _ERR_NO_JID
+
+    success, status_message = await asyncio.to_thread(whatsapp_unwatch_channel, jid)
+    if success:
+        invalidate_cache(jid, ("list_watched_channels",))
+    return _reply(success, status_message)
+
+async def _batch_watch_reply(batch_fn, items: list, jids: List[str], check_format: bool = True) -> Dict[str, Any]:
+    """Run a batched watch list change, rejecting empty and (if check_format) malformed JIDs locally."""
+    results = [None] * len(jids)
+    valid = []
+    for index, jid in enumerate(jids):
+        if not jid or (check_format and not _JID_RE.fullmatch(jid)):
+            results[index] = (False, f"Invalid JID: {jid}")
+        else:
+            valid.append(index)
+
+    if valid:
+        outcomes = await asyncio.to_thread(batch_fn, [items[index] for index in valid])
+        for index, outcome in zip(valid, outcomes):
+            results[index] = outcome
+        invalidate_cache(None, ("list_watched_channels",))
 
-    success, status_message = whatsapp_unwatch_channel(jid)
     return {
-        "success": success,
-        "message": status_message
+        "success": all(success for success, _ in results),
+        "results": [
+            {"jid": jid, "success": success, "message": message}
+            for jid, (success, message) in zip(jids, results)
+        ]
     }
 
 @mcp.tool()
-def list_watched_channels() -> Dict[str, Any]:
+async def watch_channels(jids: List[str]) -> Dict[str, Any]:
+    """Add several WhatsApp channels/chats to the watch list in one request. Each channel is named after its chat.
+
+    Args:
+        jids: The JIDs of the channels to watch
+
+    Returns:
+        A dictionary with overall success and one {jid, success, message} result per JID, in order
+    """
+    return await _batch_watch_reply(whatsapp_watch_channels, [(jid, None) for jid in jids], jids)
+
+@mcp.tool()
+async def unwatch_channels(jids: List[str]) -> Dict[str, Any]:
+    """Remove several WhatsApp channels/chats from the watch list in one request.
+
+    Args:
+        jids: The JIDs of the channels to stop watching
+
+    Returns:
+        A dictionary with overall success and one {jid, success, message} result per JID, in order
+    """
+    return await _batch_watch_reply(whatsapp_unwatch_channels, list(jids), jids, check_format=False)
+
+@mcp.tool()
+@cached_tool(ttl=60)
+async def list_watched_channels() -> Dict[str, Any]:
     """List all WhatsApp channels/chats being watched for webhook notifications.
 
     Returns:
-        A dictionary containing the list of watched channels, count, and configured webhook URL
+        A dictionary containing success, the list of watched channels, count, and configured
+        webhook URL, plus a message when the bridge could not be reached
     """
-    result = whatsapp_list_watched_channels()
-    return {
-        "success": True,
-        "channels": result.get("channels", []),
-        "count": result.get("count", 0),
-        "webhook_url": result.get("webhook_url", "")
-    }
+    result = await asyncio.to_thread(whatsapp_list_watched_channels)
+    return result
 
 @mcp.tool()
-def archive_chat(jid: str, archive: bool = True) -> Dict[str, Any]:
+async def archive_chat(jid: str, archive: bool = True) -> Dict[str, Any]:
     """Archive or unarchive a WhatsApp chat. Archiving a chat will hide it from the main chat list. Note: Archiving a chat will also unpin it if it was pinned.
 
     Args:
@@ -450,20 +753,16 @@ def archive_chat(jid: str, archive: bool = True) -> Dict[str, Any]:
         A dictionary containing success status and a status message
     """
     if not jid:
-        return {
-            "success": False,
-            "message": "JID must be provided"
-        }
+        return _ERR_NO_JID
 
-    success, status_message = whatsapp_archive_chat(jid, archive)
-    return {
-        "success": success,
-        "message": status_message
-    }
+    success, status_message = await asyncio.to_thread(whatsapp_archive_chat, jid, archive)
+    if success:
+        invalidate_cache(jid, _CHAT_LIST_TOOLS)
+    return _reply(success, status_message)
 
 
 @mcp.tool()
-def resync_app_state(names: Optional[List[str]] = None, force: bool = False) -> Dict[str, Any]:
+async def resync_app_state(names: Optional[List[str]] = None, force: bool = False) -> Dict[str, Any]:
     """Force a full resync of WhatsApp app state to fix sync issues.
 
     Use this when archive, pin, mute, or star operations fail with 409 conflict or LTHash errors.
@@ -484,11 +783,14 @@ def resync_app_state(names: Optional[List[str]] = None, force: bool = False) ->
     Returns:
         A dictionary containing success status and per-state resync results
     """
-    return whatsapp_resync_app_state(names, force=force)
+    result = await asyncio.to_thread(whatsapp_resync_app_state, names, force=force)
+    if result.get("success"):
+        invalidate_cache(None, _CHAT_NAME_TOOLS)
+    return result
 
 
 @mcp.tool()
-def get_group_info(group_jid: str) -> Dict[str, Any]:
+async def get_group_info(group_jid: str) -> Dict[str, Any]:
     """Get information about a WhatsApp group including its members.
 
     Args:
@@ -505,23 +807,17 @@ def get_group_info(group_jid: str) -> Dict[str, Any]:
         - participant_count: Number of participants
     """
     if not group_jid:
-        return {
-            "success": False,
-            "message": "group_jid must be provided"
-        }
+        return _ERR_NO_GROUP_JID
 
     if not group_jid.endswith("@g.us"):
-        return {
-            "success": False,
-            "message": "group_jid must be a group JID (ending with @g.us)"
-        }
+        return _ERR_NOT_GROUP_JID
 
-    result = whatsapp_get_group_info(group_jid)
+    result = await asyncio.to_thread(whatsapp_get_group_info, group_jid)
     return result
 
 
 @mcp.tool()
-def add_group_member(group_jid: str, participant: str) -> Dict[str, Any]:
+async def add_group_member(group_jid: str, participant: str) -> Dict[str, Any]:
     """Add a contact to a WhatsApp group. You must be an admin of the group to add members.
 
     Args:
@@ -532,29 +828,20 @@ def add_group_member(group_jid: str, participant: str) -> Dict[str, Any]:
         A dictionary containing success status, message, and results for the participant
     """
     if not group_jid:
-        return {
-            "success": False,
-            "message": "group_jid must be provided"
-        }
+        return _ERR_NO_GROUP_JID
 
     if not group_jid.endswith("@g.us"):
-        return {
-            "success": False,
-            "message": "group_jid must be a group JID (ending with @g.us)"
-        }
+        return _ERR_NOT_GROUP_JID
 
     if not participant:
-        return {
-            "success": False,
-            "message": "participant must be provided"
-        }
+        return _ERR_NO_PARTICIPANT
 
-    result = whatsapp_add_group_members(group_jid, [participant])
+    result = await asyncio.to_thread(whatsapp_add_group_members, group_jid, [participant])
     return result
 
 
 @mcp.tool()
-def remove_group_member(group_jid: str, participant: str) -> Dict[str, Any]:
+async def remove_group_member(group_jid: str, participant: str) -> Dict[str, Any]:
     """Remove a contact from a WhatsApp group. You must be an admin of the group to remove members.
 
     Args:
@@ -565,24 +852,15 @@ def remove_group_member(group_jid: str, participant: str) -> Dict[str, Any]:
         A dictionary containing success status, message, and results for the participant
     """
     if not group_jid:
-        return {
-            "success": False,
-            "message": "group_jid must be provided"
-        }
+        return _ERR_NO_GROUP_JID
 
     if not group_jid.endswith("@g.us"):
-        return {
-            "success": False,
-            "message": "group_jid must be a group JID (ending with @g.us)"
-        }
+        return _ERR_NOT_GROUP_JID
 
     if not participant:
-        return {
-            "success": False,
-            "message": "participant must be provided"
-        }
+        return _ERR_NO_PARTICIPANT
 
-    result = whatsapp_remove_group_members(group_jid, [participant])
+    result = await asyncio.to_thread(whatsapp_remove_group_members, group_jid, [participant])
     return result
 
 
@@ -591,8 +869,12 @@ if __name__ == "__main__":
     # Initialize and run the server
     transport = os.environ.get('MCP_TRANSPORT', 'stdio')
     port = int(os.environ.get('MCP_PORT', '8000'))
+    # Connect to the bridge in the background so startup isn't held up by it
+    threading.Thread(target=whatsapp_warm_bridge_connection, name="bridge-warmup", daemon=True).start()
     if transport == 'sse':
         import uvicorn
+        # uvicorn picks uvloop and httptools automatically when they are installed.
+        # Stay on a single worker: SSE sessions live in this process's memory.
         uvicorn.run(mcp.sse_app(), host='0.0.0.0', port=port)
     else:
         mcp.run(transport='stdio')
\ No newline at end of file
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+class SendQueue:
+    """
+    Coalesce concurrent sends into batched requests to the bridge.
+
+    A single background flusher drains the queue. Whatever is already waiting
+    when it wakes up (up to max_batch items) is sent together; if that is only
+    one item it goes out immediately, so there is no added latency at low load.
+    When more than one item is waiting the flusher lingers up to max_wait seconds
+    to fill the batch. Items are sent in submission order.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[dict]], List[Tuple[bool, str]]],
+        max_batch: int = 32,
+        max_wait: float = 0.02
+    ):
+        """
+        Args:
+            send_batch: Blocking callable taking a list of payloads and returning
+                        one (success, message) tuple per payload, in order
+            max_batch: Maximum number of payloads per request (default 32)
+            max_wait: Seconds to wait for more payloads once a batch has started (default 0.02)
+        """
+        self.send_batch = send_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def submit(self, payload: dict) -> Tuple[bool, str]:
+        """Queue a payload and wait for its (success, message) result."""
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_forever())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _flush_forever(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            if len(batch) > 1:
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+            payloads = [payload for payload, _ in batch]
+            try:
+                results = await asyncio.to_thread(self.send_batch, payloads)
+            except Exception as e:
+                results = [(False, f"Unexpected error: {str(e)}")] * len(batch)
+
+            for index, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                if index < len(results):
+                    future.set_result(results[index])
+                else:
+                    future.set_result((False, "No result returned for this message"))
@@ -0,0 +1,64 @@
+import os
+import shutil
+import subprocess
+import time
+
+import pytest
+
+import audio
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+
+
+@pytest.fixture
+def wav_file(tmp_path):
+    path = tmp_path / "tone.wav"
+    subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-y", "-f", "lavfi", "-i", "sine=duration=1", str(path)],
+        check=True
+    )
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def audio_cache_dir(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(audio, "_AUDIO_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(audio, "_converted_cache", audio.OrderedDict())
+    monkeypatch.setattr(audio, "_audio_cache_returned", {})
+    return cache_dir
+
+
+def test_cached_conversion_produces_opus_ogg(wav_file, audio_cache_dir):
+    output = audio.convert_to_opus_ogg_cached(wav_file)
+
+    assert os.path.dirname(output) == audio_cache_dir
+    assert output.endswith(".ogg")
+    assert audio.is_opus_ogg(output)
+    # No partial files are left behind next to the result
+    assert [name for name in os.listdir(audio_cache_dir) if not name.endswith(".ogg")] == []
+
+
+def test_cached_conversion_is_reused(wav_file):
+    first = audio.convert_to_opus_ogg_cached(wav_file)
+    mtime = os.stat(first).st_mtime_ns
+
+    assert audio.convert_to_opus_ogg_cached(wav_file) == first
+    assert os.stat(first).st_mtime_ns == mtime
+
+
+def test_prune_keeps_recently_used_files(audio_cache_dir, monkeypatch):
+    monkeypatch.setattr(audio, "_AUDIO_CACHE_MAX_FILES", 1)
+    os.makedirs(audio_cache_dir)
+    old = time.time() - audio._AUDIO_CACHE_GRACE_SECONDS - 60
+    paths = [os.path.join(audio_cache_dir, f"{n}.ogg") for n in range(4)]
+    for path in paths:
+        open(path, "wb").close()
+    for path in paths[:3]:
+        os.utime(path, (old, old))
+    # Handed out recently, so it is still in use despite its old mtime
+    audio._audio_cache_returned[paths[0]] = time.time()
+
+    audio._prune_audio_cache()
+
+    assert sorted(os.listdir(audio_cache_dir)) == ["0.ogg", "3.ogg"]
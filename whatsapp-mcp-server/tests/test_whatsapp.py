@@ -0,0 +1,361 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+import main
+import whatsapp
+from send_queue import SendQueue
+
+
+@pytest.fixture
+def messages_db(tmp_path, monkeypatch):
+    path = str(tmp_path / "messages.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE chats (jid TEXT PRIMARY KEY, name TEXT, last_message_time TIMESTAMP)")
+    conn.commit()
+    monkeypatch.setattr(whatsapp, "_messages_pool", whatsapp.ConnectionPool(path))
+    monkeypatch.setattr(whatsapp, "get_contact_names_from_whatsmeow", lambda jids: {jid: None for jid in jids})
+    whatsapp._sender_name_cache.clear()
+    yield conn
+    whatsapp._messages_pool.close()
+    whatsapp._sender_name_cache.clear()
+    conn.close()
+
+
+def test_sender_name_prefers_named_exact_match(messages_db):
+    messages_db.executemany("INSERT INTO chats (jid, name) VALUES (?, ?)", [
+        ("15551234567@s.whatsapp.net", "Exact"),
+        ("15551234567@lid", "Same phone"),
+    ])
+    messages_db.commit()
+
+    assert whatsapp._resolve_sender_names(["15551234567@s.whatsapp.net"]) == {
+        "15551234567@s.whatsapp.net": "Exact"
+    }
+
+
+def test_sender_name_skips_unnamed_exact_match(messages_db):
+    messages_db.executemany("INSERT INTO chats (jid, name) VALUES (?, ?)", [
+        ("15551234567@s.whatsapp.net", None),
+        ("15551234567@lid", "Same phone"),
+    ])
+    messages_db.commit()
+
+    assert whatsapp._resolve_sender_names(["15551234567@s.whatsapp.net"]) == {
+        "15551234567@s.whatsapp.net": "Same phone"
+    }
+
+
+def test_sender_name_falls_back_to_phone_number(messages_db):
+    messages_db.execute("INSERT INTO chats (jid, name) VALUES (?, ?)", ("15551234567@s.whatsapp.net", None))
+    messages_db.commit()
+
+    assert whatsapp._resolve_sender_names(["15551234567@s.whatsapp.net", "15559876543@s.whatsapp.net"]) == {
+        "15551234567@s.whatsapp.net": "15551234567",
+        "15559876543@s.whatsapp.net": "15559876543",
+    }
+
+
+_MESSAGES_SCHEMA = """
+    CREATE TABLE messages (
+        id TEXT, chat_jid TEXT, sender TEXT, content TEXT, timestamp TIMESTAMP, is_from_me BOOLEAN,
+        media_type TEXT, filename TEXT, reply_to_id TEXT, reply_to_sender TEXT, reply_to_content TEXT,
+        PRIMARY KEY (id, chat_jid)
+    )
+"""
+
+_MESSAGES_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE messages_fts USING fts5(
+        content, media_type, filename, content='messages', content_rowid='rowid'
+    );
+    CREATE TRIGGER messages_fts_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(rowid, content, media_type, filename)
+        VALUES (new.rowid, new.content, new.media_type, new.filename);
+    END;
+"""
+
+
+def _add_messages(conn, contents, chat_jid="15551234567@s.whatsapp.net"):
+    conn.execute("INSERT OR IGNORE INTO chats (jid, name) VALUES (?, ?)", (chat_jid, "Chat"))
+    conn.executemany(
+        "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, ?, ?, ?, ?, 1)",
+        [(f"m{i:02d}", chat_jid, "me", content, f"2024-01-01 10:{i:02d}:00+00:00") for i, content in enumerate(contents)]
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def message_store(messages_db, monkeypatch):
+    messages_db.execute(_MESSAGES_SCHEMA)
+    messages_db.executescript(_MESSAGES_FTS_SCHEMA)
+    monkeypatch.setattr(whatsapp, "_fts_tables", set())
+    return messages_db
+
+
+def _contents(**kwargs):
+    return [message.content for batch, _ in whatsapp.iter_messages(**kwargs) for message in batch]
+
+
+def test_cursor_round_trip():
+    cursor = whatsapp._encode_cursor("2024-01-01 10:00:00+00:00", "m01")
+    assert whatsapp._decode_cursor(cursor, 2) == ["2024-01-01 10:00:00+00:00", "m01"]
+
+    with pytest.raises(ValueError):
+        whatsapp._decode_cursor(cursor, 3)
+    with pytest.raises(ValueError):
+        whatsapp._decode_cursor("not a cursor", 2)
+
+
+def test_list_messages_pages_without_gaps_or_overlap(message_store):
+    _add_messages(message_store, [f"message {i}" for i in range(6)])
+
+    pages = []
+    cursor = None
+    while True:
+        text, cursor = whatsapp.list_messages(limit=3, cursor=cursor, include_context=False)
+        pages.append(text)
+        if cursor is None:
+            break
+
+    # A full last page still hands out a cursor; the page after it is empty and ends paging
+    assert len(pages) == 3
+    assert [text.count("message ") for text in pages] == [3, 3, 0]
+    assert "message 5" in pages[0] and "message 0" in pages[1]
+
+
+def test_list_chats_cursor_ends_on_short_page(messages_db):
+    messages_db.executemany("INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)", [
+        (f"1555000000{i}@s.whatsapp.net", f"Chat {i}", f"2024-01-0{i + 1} 00:00:00") for i in range(5)
+    ])
+    messages_db.commit()
+
+    first, cursor = whatsapp.list_chats(limit=3, include_last_message=False)
+    second, last_cursor = whatsapp.list_chats(limit=3, cursor=cursor, include_last_message=False)
+
+    assert [chat.name for chat in first] == ["Chat 4", "Chat 3", "Chat 2"]
+    assert [chat.name for chat in second] == ["Chat 1", "Chat 0"]
+    assert last_cursor is None
+
+
+def test_fts_query_translation():
+    assert whatsapp._fts_query("meet") == ('"meet"*', [])
+    assert whatsapp._fts_query("meet at 5pm") == ('"meet"* "5pm"*', ["at"])
+    assert whatsapp._fts_query("at 5") == ('"at"* "5"*', [])
+    assert whatsapp._fts_query('say "hi"') == ('say "hi"', [])
+    assert whatsapp._fts_query("cats OR dogs") == ("cats OR dogs", [])
+
+
+def test_fts_search_matches_prefixes_and_filters_short_terms(message_store):
+    _add_messages(message_store, ["meeting at noon", "meeting tomorrow", "unrelated"])
+
+    assert _contents(query="meet") == ["meeting tomorrow", "meeting at noon"]
+    assert _contents(query="meet at") == ["meeting at noon"]
+
+
+def test_fts_search_falls_back_to_literal_phrase(message_store):
+    _add_messages(message_store, ['say "hi', "something else"])
+
+    assert _contents(query='say "hi') == ['say "hi']
+
+
+def test_search_without_fts_index_uses_like(messages_db, monkeypatch):
+    messages_db.execute(_MESSAGES_SCHEMA)
+    monkeypatch.setattr(whatsapp, "_fts_tables", set())
+    _add_messages(messages_db, ["Meeting at noon", "unrelated"])
+
+    assert _contents(query="eting") == ["Meeting at noon"]
+
+
+@pytest.fixture
+def bridge(monkeypatch):
+    calls = []
+    responses = []
+
+    def fake_call_bridge(method, url, payload=None, params=None, timeout=None, headers=None):
+        calls.append({"method": method, "url": url, "params": params, "headers": headers})
+        return responses.pop(0)
+
+    monkeypatch.setattr(whatsapp, "_call_bridge", fake_call_bridge)
+    whatsapp._scheduled_etags.clear()
+    yield calls, responses
+    whatsapp._scheduled_etags.clear()
+
+
+def test_scheduled_page_revalidates_with_etag(bridge):
+    calls, responses = bridge
+    page = {"data": [{"id": 1, "scheduled_time": "2024-01-01T10:00:00Z"}], "has_more": False, "etag": '"v1"'}
+    responses.extend([(True, "OK", page), (True, "Not modified", None)])
+
+    first = whatsapp.list_scheduled_messages(status="pending")
+    second = whatsapp.list_scheduled_messages(status="pending")
+
+    assert first == (page["data"], None, False)
+    assert second == first
+    assert calls[0]["headers"] is None
+    assert calls[1]["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_scheduled_page_cursor_and_failure(bridge):
+    calls, responses = bridge
+    page = {"data": [{"id": 7, "scheduled_time": "2024-01-01T10:00:00Z"}], "has_more": True}
+    responses.extend([(True, "OK", page), (False, "Bridge unreachable", None)])
+
+    messages, next_cursor, has_more = whatsapp.list_scheduled_messages(limit=1)
+    assert has_more and whatsapp._decode_cursor(next_cursor, 2) == ["2024-01-01T10:00:00Z", 7]
+
+    assert whatsapp.list_scheduled_messages(limit=1, cursor=next_cursor) is None
+    assert calls[1]["params"] == {"limit": 1, "after_time": "2024-01-01T10:00:00Z", "after_id": 7}
+    assert whatsapp.list_scheduled_messages(cursor="not a cursor") is None
+
+
+@pytest.fixture
+def tool_cache():
+    main._tool_cache.clear()
+    yield main._tool_cache
+    main._tool_cache.clear()
+
+
+def test_cached_tool_hits_misses_and_invalidates(tool_cache):
+    calls = []
+
+    @main.cached_tool(ttl=60)
+    async def lookup(jid):
+        calls.append(jid)
+        return {"jid": jid}
+
+    async def scenario():
+        await lookup("15551234567@s.whatsapp.net")
+        await lookup("15551234567@s.whatsapp.net")
+        await lookup("15559876543@s.whatsapp.net")
+        main.invalidate_cache("15551234567")
+        await lookup("15551234567@s.whatsapp.net")
+        await lookup("15559876543@s.whatsapp.net")
+        main.invalidate_cache(tools=("lookup",))
+        await lookup("15559876543@s.whatsapp.net")
+
+    asyncio.run(scenario())
+    assert calls == [
+        "15551234567@s.whatsapp.net",
+        "15559876543@s.whatsapp.net",
+        "15551234567@s.whatsapp.net",
+        "15559876543@s.whatsapp.net",
+    ]
+
+
+def test_cached_tool_does_not_cache_failures(tool_cache):
+    results = [None, {"success": False, "message": "down"}, sqlite3.OperationalError("locked"), {"success": True}]
+    calls = []
+
+    @main.cached_tool(ttl=60)
+    async def flaky():
+        calls.append(1)
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def scenario():
+        assert await flaky() is None
+        assert await flaky() == {"success": False, "message": "down"}
+        with pytest.raises(sqlite3.OperationalError):
+            await flaky()
+        assert await flaky() == {"success": True}
+        assert await flaky() == {"success": True}
+
+    asyncio.run(scenario())
+    assert len(calls) == 4
+
+
+def _recording_sender(batches, fail_on=None):
+    def send_batch(payloads):
+        batches.append([payload["n"] for payload in payloads])
+        return [(payload["n"] != fail_on, f"sent {payload['n']}") for payload in payloads]
+    return send_batch
+
+
+def test_send_queue_sends_single_item_at_once():
+    batches = []
+    queue = SendQueue(_recording_sender(batches), max_wait=5)
+
+    async def scenario():
+        return await asyncio.wait_for(queue.submit({"n": 0}), timeout=1)
+
+    assert asyncio.run(scenario()) == (True, "sent 0")
+    assert batches == [[0]]
+
+
+def test_send_queue_batches_in_order_up_to_max_batch():
+    batches = []
+    queue = SendQueue(_recording_sender(batches, fail_on=2), max_batch=3, max_wait=0.01)
+
+    async def scenario():
+        return await asyncio.gather(*(queue.submit({"n": n}) for n in range(5)))
+
+    results = asyncio.run(scenario())
+    assert [n for batch in batches for n in batch] == [0, 1, 2, 3, 4]
+    assert batches[0] == [0, 1, 2]
+    assert results[2] == (False, "sent 2")
+    assert results[4] == (True, "sent 4")
+
+
+def test_send_queue_lingers_to_fill_batch():
+    batches = []
+    queue = SendQueue(_recording_sender(batches), max_batch=8, max_wait=0.5)
+
+    async def scenario():
+        first = asyncio.gather(queue.submit({"n": 0}), queue.submit({"n": 1}))
+        await asyncio.sleep(0.05)
+        late = await queue.submit({"n": 2})
+        await first
+        return late
+
+    assert asyncio.run(scenario()) == (True, "sent 2")
+    assert batches == [[0, 1, 2]]
+
+
+def test_send_queue_reports_sender_errors_per_item():
+    def send_batch(payloads):
+        if len(payloads) > 1:
+            return [(True, "sent")]
+        raise RuntimeError("bridge down")
+
+    async def scenario():
+        queue = SendQueue(send_batch)
+        batched = await asyncio.gather(queue.submit({}), queue.submit({}))
+        single = await queue.submit({})
+        return batched, single
+
+    batched, single = asyncio.run(scenario())
+    assert batched == [(True, "sent"), (False, "No result returned for this message")]
+    assert single == (False, "Unexpected error: bridge down")
+
+
+@pytest.fixture
+def send_queue(monkeypatch, tool_cache):
+    batches = []
+    monkeypatch.setattr(main, "_send_queue", SendQueue(_recording_sender(batches)))
+    main._send_status.clear()
+    yield batches
+    main._send_status.clear()
+
+
+def test_queue_send_ack_modes(send_queue):
+    async def scenario():
+        synced = await main._queue_send({"n": 0}, "15551234567", "sync")
+        fired = await main._queue_send({"n": 1}, "15551234567", "fire")
+        eventual = await main._queue_send({"n": 2}, "15551234567", "eventual")
+        pending = await main.get_send_status(eventual["send_id"])
+        await asyncio.gather(*main._background_sends)
+        done = await main.get_send_status(eventual["send_id"])
+        invalid = await main._queue_send({"n": 3}, "15551234567", "later")
+        return synced, fired, eventual, pending, done, invalid
+
+    synced, fired, eventual, pending, done, invalid = asyncio.run(scenario())
+    assert synced == {"success": True, "message": "sent 0"}
+    assert fired == {"success": True, "message": "Queued"}
+    assert eventual["success"] and eventual["message"] == "Queued"
+    assert pending["status"] == "pending"
+    assert done == {"success": True, "send_id": eventual["send_id"], "status": "sent", "message": "sent 2"}
+    assert invalid["success"] is False
+    assert sorted(n for batch in send_queue for n in batch) == [0, 1, 2]
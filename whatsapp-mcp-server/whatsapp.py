@@ -1,20 +1,148 @@
+import atexit
 import sqlite3
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Iterator, Union
 import os.path
+import stat
+import base64
+import socket
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import orjson
 import audio
+from cache import TTLCache
 
 MESSAGES_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'whatsapp-bridge', 'store', 'messages.db')
 WHATSMEOW_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'whatsapp-bridge', 'store', 'whatsapp.db')
 WHATSAPP_API_BASE_URL = "http://localhost:8080/api"
 
-# Cache for contact names to avoid repeated database lookups
-_contact_name_cache = {}
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Bridge endpoints, built once
+_URL_SEND = f"{WHATSAPP_API_BASE_URL}/send"
+_URL_SEND_BATCH = f"{WHATSAPP_API_BASE_URL}/send/batch"
+_URL_DOWNLOAD = f"{WHATSAPP_API_BASE_URL}/download"
+_URL_SCHEDULE = f"{WHATSAPP_API_BASE_URL}/schedule"
+_URL_WATCH = f"{WHATSAPP_API_BASE_URL}/watch"
+_URL_WATCH_BATCH = f"{WHATSAPP_API_BASE_URL}/watch/batch"
+_URL_ARCHIVE = f"{WHATSAPP_API_BASE_URL}/archive"
+_URL_GROUP = f"{WHATSAPP_API_BASE_URL}/group"
+_URL_GROUP_MEMBERS = f"{WHATSAPP_API_BASE_URL}/group/members"
+_URL_RESYNC_STATE = f"{WHATSAPP_API_BASE_URL}/resync-state"
+
+# Keep-alive connections to the bridge, shared by every request. Only connection
+# failures are retried: a send whose request reached the bridge must not be repeated.
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.1)
+))
+
+# (connect, read) timeouts in seconds; reads allow for the bridge uploading or downloading media
+_HTTP_TIMEOUT = (3, 120)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# media_path values with these prefixes are URLs the bridge downloads itself
+_HTTP_SCHEMES = ("http://", "https://")
+
+def warm_bridge_connection() -> bool:
+    """Open a pooled keep-alive connection so the first real request doesn't wait on connect.
+
+    Call once at server startup. A single plain connect is tried first, so when
+    the bridge isn't up yet this returns quietly instead of going through the
+    session's connect retries.
+
+    Returns:
+        True if the bridge answered and a connection is now pooled
+    """
+    address = urlsplit(WHATSAPP_API_BASE_URL)
+    try:
+        socket.create_connection((address.hostname, address.port or 80), timeout=1).close()
+    except OSError:
+        return False
+    try:
+        # No handler is registered for the bare prefix, so the bridge just answers 404
+        _session.head(WHATSAPP_API_BASE_URL, timeout=_HTTP_TIMEOUT)
+    except requests.RequestException:
+        return False
+    return True
+
+def _call_bridge(
+    method: str,
+    url: str,
+    payload=None,
+    params: Optional[dict] = None,
+    timeout=_HTTP_TIMEOUT,
+    headers: Optional[dict] = None
+) -> Tuple[bool, str, Optional[dict]]:
+    """Make a JSON request to the bridge and unpack its standard reply.
+
+    Transport, decoding and unexpected errors are folded into the returned
+    message so callers only shape the result.
+
+    Args:
+        method: HTTP method
+        url: Full bridge endpoint URL
+        payload: Optional JSON body, encoded with orjson
+        params: Optional query string parameters
+        timeout: (connect, read) timeout in seconds (default _HTTP_TIMEOUT)
+        headers: Optional extra request headers, e.g. If-None-Match
+
+    Returns:
+        Tuple of (success, status_message, decoded reply). The reply is None on
+        error, and on a 304 Not Modified, which is reported as a success.
+    """
+    try:
+        if payload is None:
+            response = _session.request(method, url, params=params, headers=headers, timeout=timeout)
+        else:
+            response = _session.request(
+                method, url, params=params, data=orjson.dumps(payload),
+                headers=dict(_JSON_HEADERS, **headers) if headers else _JSON_HEADERS, timeout=timeout
+            )
+        if response.status_code == 304:
+            return True, "Not modified", None
+        result = orjson.loads(response.content)
+        # Every bridge JSON reply carries "success"; list replies have no "message"
+        return result["success"], result.get("message", "Unknown error"), result
+    except requests.RequestException as e:
+        return False, f"Request error: {str(e)}", None
+    except (json.JSONDecodeError, KeyError):
+        # Requests the bridge rejects outright (bad input, wrong method) get a plain-text reply
+        if response.status_code != 200:
+            return False, f"Error: HTTP {response.status_code} - {response.text}", None
+        return False, "Error parsing response", None
+    except Exception as e:
+        return False, f"Unexpected error: {str(e)}", None
+
+# Cache for contact names and LID resolutions to avoid repeated database lookups.
+# Bounded, and entries expire so renamed contacts and new LID mappings are picked up
+_contact_name_cache = TTLCache(maxsize=8192, ttl=3600)
+_NOT_CACHED = object()
+
+# Resolved sender display names, including phone-number fallbacks so misses
+# don't repeat the LIKE search; expire so renamed contacts are picked up
+_sender_name_cache = TTLCache(maxsize=4096, ttl=3600)
+
+# Full-text index tables the bridge has been seen to create (checked lazily)
+_fts_tables = set()
+
+# Last validated schedule page and its ETag per (status, limit, cursor), so a
+# re-poll of an unchanged page is answered with 304 and not decoded again
+_scheduled_etags = TTLCache(maxsize=64, ttl=300)
+
+@dataclass(slots=True)
 class Message:
     timestamp: datetime
     sender: str
@@ -29,7 +157,7 @@ class Message:
     reply_to_sender: Optional[str] = None
     reply_to_content: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Chat:
     jid: str
     name: Optional[str]
@@ -43,18 +171,93 @@ class Chat:
         """Determine if chat is a group based on JID pattern."""
         return self.jid.endswith("@g.us")
 
-@dataclass
+@dataclass(slots=True)
 class Contact:
     phone_number: str
     name: Optional[str]
     jid: str
 
-@dataclass
+@dataclass(slots=True)
 class MessageContext:
     message: Message
     before: List[Message]
     after: List[Message]
 
+class ConnectionPool:
+    """A pool of reusable read-only connections to a SQLite database.
+
+    The bridge owns all writes, so connections are opened query_only. They are
+    created lazily up to size; when every pooled connection is in use an extra
+    one is opened for the caller and closed on release rather than blocking,
+    which keeps nested lookups (e.g. sender names while formatting) deadlock free.
+    """
+
+    def __init__(self, path: str, size: Optional[int] = None):
+        self.path = path
+        self.size = size or max(4, 2 * (os.cpu_count() or 1))
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # list_messages and list_chats assemble their SQL from optional filters, so
+        # there are more distinct statements than the default cache of 128 holds
+        conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=512)
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -16000")
+        return conn
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection for the duration of a with block."""
+        pooled = True
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                pooled = self._created < self.size
+                if pooled:
+                    self._created += 1
+            try:
+                conn = self._connect()
+            except sqlite3.Error:
+                if pooled:
+                    with self._lock:
+                        self._created -= 1
+                raise
+        try:
+            yield conn
+        finally:
+            if pooled:
+                self._idle.put(conn)
+            else:
+                conn.close()
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+
+_messages_pool = ConnectionPool(MESSAGES_DB_PATH)
+_whatsmeow_pool = ConnectionPool(WHATSMEOW_DB_PATH)
+atexit.register(_messages_pool.close)
+atexit.register(_whatsmeow_pool.close)
+
+@lru_cache(maxsize=8192)
+def _phone_from_jid(jid: str) -> str:
+    """Return the user part of a JID (the phone number for @s.whatsapp.net), or jid if it has no server."""
+    i = jid.find('@')
+    return jid[:i] if i >= 0 else jid
+
 def resolve_lid_to_phone(jid: str) -> str:
     """Resolve a LID-based JID to its phone-number JID.
 
@@ -78,32 +281,163 @@ def resolve_lid_to_phone(jid: str) -> str:
 
     # Check cache first
     cache_key = f"lid_resolve:{lid_user}"
-    if cache_key in _contact_name_cache:
-        return _contact_name_cache[cache_key]
+    cached = _contact_name_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        conn = sqlite3.connect(WHATSMEOW_DB_PATH)
-        cursor = conn.cursor()
+        with _whatsmeow_pool.acquire() as conn:
+            cursor = conn.cursor()
 
+            cursor.execute(
+                "SELECT pn FROM whatsmeow_lid_map WHERE lid = ? LIMIT 1",
+                (lid_user,)
+            )
+
+            result = cursor.fetchone()
+            if result:
+                phone_jid = f"{result[0]}@s.whatsapp.net"
+                _contact_name_cache.set(cache_key, phone_jid)
+                return phone_jid
+
+            _contact_name_cache.set(cache_key, jid)
+            return jid
+
+    except sqlite3.Error:
+        return jid
+
+
+# Stay well under SQLite's bound-parameter limit when building IN (...) lists
+_MAX_SQL_PARAMS = 500
+
+# The user (phone number) part of chats.jid, written exactly as in the bridge's
+# idx_chats_phone expression index so lookups on it are index seeks
+_CHAT_PHONE_SQL = "substr(jid, 1, instr(jid, '@') - 1)"
+
+def _prefetch_lid_resolutions(cursor: sqlite3.Cursor, jids) -> None:
+    """Warm resolve_lid_to_phone's cache for every uncached LID among jids in one pass."""
+    lid_users = {}
+    for jid in jids:
+        if '@' in jid and not jid.endswith('@lid'):
+            continue
+        lid_user = jid.split('@')[0]
+        if _contact_name_cache.get(f"lid_resolve:{lid_user}") is None:
+            lid_users.setdefault(lid_user, jid)
+    if not lid_users:
+        return
+
+    users = list(lid_users)
+    phones = {}
+    for i in range(0, len(users), _MAX_SQL_PARAMS):
+        chunk = users[i:i + _MAX_SQL_PARAMS]
         cursor.execute(
-            "SELECT pn FROM whatsmeow_lid_map WHERE lid = ? LIMIT 1",
-            (lid_user,)
+            f"SELECT lid, pn FROM whatsmeow_lid_map WHERE lid IN ({','.join('?' * len(chunk))})",
+            chunk
         )
+        phones.update(cursor.fetchall())
 
-        result = cursor.fetchone()
-        if result:
-            phone_jid = f"{result[0]}@s.whatsapp.net"
-            _contact_name_cache[cache_key] = phone_jid
-            return phone_jid
+    for lid_user, jid in lid_users.items():
+        pn = phones.get(lid_user)
+        _contact_name_cache.set(f"lid_resolve:{lid_user}", f"{pn}@s.whatsapp.net" if pn else jid)
 
-        _contact_name_cache[cache_key] = jid
-        return jid
+
+def get_contact_names_from_whatsmeow(jids) -> dict:
+    """Get whatsmeow contact names for many JIDs with batched queries.
+
+    Each JID is looked up as in get_contact_name_from_whatsmeow: LIDs are
+    resolved to phone JIDs, then matched exactly, then by phone number under
+    any server. Results, including misses, are cached per normalized JID.
+
+    Args:
+        jids: Iterable of JIDs
+
+    Returns:
+        A dictionary mapping each JID to its contact name, or None if not found
+    """
+    names = {}
+    pending = {}
+    jids = set(jids)
+
+    try:
+        with _whatsmeow_pool.acquire() as conn:
+            cursor = conn.cursor()
+            _prefetch_lid_resolutions(cursor, jids)
+
+            for jid in jids:
+                # Normalize JID - ensure it has the @s.whatsapp.net suffix for individual contacts
+                resolved_jid = resolve_lid_to_phone(jid)
+                normalized_jid = resolved_jid if '@' in resolved_jid else f"{resolved_jid}@s.whatsapp.net"
+                cached = _contact_name_cache.get(normalized_jid, _NOT_CACHED)
+                if cached is not _NOT_CACHED:
+                    names[jid] = cached
+                else:
+                    pending[jid] = normalized_jid
+            if not pending:
+                return names
+
+            # Exact matches first, then the phone number under any server (in case JID
+            # format varies) for the JIDs still unnamed.
+            # Priority: full_name > push_name > business_name, from the first named row.
+            # Contacts are keyed by (our_jid, their_jid), so both statements pin our_jid
+            # to the paired devices; CROSS JOIN keeps SQLite from scanning contacts first.
+            # The phone lookup is a their_jid range, 'phone@' <= their_jid < 'phoneA',
+            # since 'A' follows '@'.
+            items = list(pending.items())
+            exact_names = {}
+            part_names = {}
+            step = _MAX_SQL_PARAMS // 2
+            for i in range(0, len(items), step):
+                chunk = items[i:i + step]
+                normalized = list({normalized_jid for _, normalized_jid in chunk})
+                cursor.execute(
+                    f"""SELECT c.their_jid, c.full_name, c.push_name, c.business_name
+                        FROM whatsmeow_device d
+                        CROSS JOIN whatsmeow_contacts c ON c.our_jid = d.jid
+                        WHERE c.their_jid IN ({','.join('?' * len(normalized))})""",
+                    normalized
+                )
+                for their_jid, full_name, push_name, business_name in cursor.fetchall():
+                    name = full_name or push_name or business_name
+                    if name:
+                        exact_names.setdefault(their_jid, name)
+
+                parts = list({
+                    jid.split('@')[0] for jid, normalized_jid in chunk
+                    if '@' in jid and normalized_jid not in exact_names
+                })
+                if not parts:
+                    continue
+                cursor.execute(
+                    f"""WITH parts(lo, hi) AS (VALUES {', '.join(['(?, ?)'] * len(parts))})
+                        SELECT c.their_jid, c.full_name, c.push_name, c.business_name
+                        FROM whatsmeow_device d
+                        CROSS JOIN parts
+                        CROSS JOIN whatsmeow_contacts c
+                            ON c.our_jid = d.jid AND c.their_jid >= parts.lo AND c.their_jid < parts.hi""",
+                    [bound for part in parts for bound in (f"{part}@", f"{part}A")]
+                )
+                for their_jid, full_name, push_name, business_name in cursor.fetchall():
+                    name = full_name or push_name or business_name
+                    if name:
+                        part_names.setdefault(their_jid.split('@')[0], name)
+
+            for jid, normalized_jid in items:
+                name = exact_names.get(normalized_jid)
+                if not name and '@' in jid:
+                    name = part_names.get(jid.split('@')[0])
+                names[jid] = name or None
 
     except sqlite3.Error:
-        return jid
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.exception("Database error while getting contact names from whatsmeow")
+        for jid in jids:
+            names.setdefault(jid, None)
+        return names
+
+    # Cache hits and misses alike
+    for jid, normalized_jid in pending.items():
+        names.setdefault(jid, None)
+        _contact_name_cache.set(normalized_jid, names[jid])
+    return names
 
 
 def get_contact_name_from_whatsmeow(jid: str) -> Optional[str]:
@@ -115,128 +449,100 @@ def get_contact_name_from_whatsmeow(jid: str) -> Optional[str]:
     Returns:
         The contact's display name (full_name, push_name, or business_name), or None if not found
     """
-    global _contact_name_cache
+    return get_contact_names_from_whatsmeow((jid,))[jid]
 
-    # Resolve LID JIDs to phone JIDs first
-    resolved_jid = resolve_lid_to_phone(jid)
 
-    # Normalize JID - ensure it has the @s.whatsapp.net suffix for individual contacts
-    normalized_jid = resolved_jid
-    if '@' not in resolved_jid:
-        normalized_jid = f"{resolved_jid}@s.whatsapp.net"
+def clear_contact_cache() -> None:
+    """Forget cached contact names, sender names and LID resolutions.
 
-    # Check cache first
-    if normalized_jid in _contact_name_cache:
-        return _contact_name_cache[normalized_jid]
+    Entries otherwise live for an hour; call this after the bridge has rewritten
+    contacts (e.g. an app state resync) to pick up renames straight away.
+    """
+    _contact_name_cache.clear()
+    _sender_name_cache.clear()
 
-    try:
-        conn = sqlite3.connect(WHATSMEOW_DB_PATH)
-        cursor = conn.cursor()
-
-        # Query whatsmeow_contacts table for the contact name
-        # Priority: full_name > push_name > business_name
-        cursor.execute("""
-            SELECT full_name, push_name, business_name
-            FROM whatsmeow_contacts
-            WHERE their_jid = ?
-            LIMIT 1
-        """, (normalized_jid,))
-
-        result = cursor.fetchone()
-
-        if result:
-            full_name, push_name, business_name = result
-            # Return the first non-empty name
-            name = full_name or push_name or business_name
-            if name:
-                _contact_name_cache[normalized_jid] = name
-                return name
-
-        # Also try without the suffix (in case JID format varies)
-        if '@' in jid:
-            phone_part = jid.split('@')[0]
-            cursor.execute("""
-                SELECT full_name, push_name, business_name
-                FROM whatsmeow_contacts
-                WHERE their_jid LIKE ?
-                LIMIT 1
-            """, (f"{phone_part}@%",))
 
-            result = cursor.fetchone()
-            if result:
-                full_name, push_name, business_name = result
-                name = full_name or push_name or business_name
-                if name:
-                    _contact_name_cache[normalized_jid] = name
-                    return name
+def _resolve_sender_names(sender_jids) -> dict:
+    """Resolve display names for many sender JIDs with batched queries.
 
-        # Cache the miss as None
-        _contact_name_cache[normalized_jid] = None
-        return None
+    Names come from whatsmeow contacts first, then from an exact match in the
+    chats table, then from any chat with the same phone number. Chats without a
+    name are skipped at each step, so an unnamed exact match still falls back
+    to a named same-phone chat. Senders with no name map to their phone number part.
 
-    except sqlite3.Error as e:
-        print(f"Database error while getting contact name from whatsmeow: {e}")
-        return None
-    finally:
-        if 'conn' in locals():
-            conn.close()
+    Args:
+        sender_jids: Iterable of sender JIDs
 
+    Returns:
+        A dictionary mapping each sender JID to its display name
+    """
+    names = {}
+    uncached = []
+    for jid in set(sender_jids):
+        cached = _sender_name_cache.get(jid)
+        if cached is not None:
+            names[jid] = cached
+        else:
+            uncached.append(jid)
 
-def get_sender_name(sender_jid: str) -> str:
-    """Get display name for a sender JID.
+    unresolved = []
+    for jid, contact_name in get_contact_names_from_whatsmeow(uncached).items():
+        if contact_name:
+            names[jid] = contact_name
+            _sender_name_cache.set(jid, contact_name)
+        else:
+            unresolved.append(jid)
 
-    Looks up contact name from whatsmeow contacts first, then falls back to chats table.
-    """
-    # First try to get contact name from whatsmeow contacts
-    contact_name = get_contact_name_from_whatsmeow(sender_jid)
-    if contact_name:
-        return contact_name
+    if not unresolved:
+        return names
 
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-
-        # First try matching by exact JID
-        cursor.execute("""
-            SELECT name
-            FROM chats
-            WHERE jid = ?
-            LIMIT 1
-        """, (sender_jid,))
-
-        result = cursor.fetchone()
-
-        # If no result, try looking for the number within JIDs
-        if not result:
-            # Extract the phone number part if it's a JID
-            if '@' in sender_jid:
-                phone_part = sender_jid.split('@')[0]
-            else:
-                phone_part = sender_jid
+        with _messages_pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            # Exact JID matches and same-phone matches come back from one
+            # statement per chunk; a named exact match wins over a named phone match
+            phone_parts = {jid: _phone_from_jid(jid) for jid in unresolved}
+            chat_names = {}
+            part_names = {}
+            step = _MAX_SQL_PARAMS // 2
+            for i in range(0, len(unresolved), step):
+                chunk = unresolved[i:i + step]
+                parts = list({phone_parts[jid] for jid in chunk})
+                cursor.execute(
+                    f"""SELECT jid, {_CHAT_PHONE_SQL}, name FROM chats
+                        WHERE jid IN ({','.join('?' * len(chunk))})
+                           OR {_CHAT_PHONE_SQL} IN ({','.join('?' * len(parts))})""",
+                    chunk + parts
+                )
+                for jid, part, name in cursor.fetchall():
+                    if name:
+                        chat_names[jid] = name
+                        part_names.setdefault(part, name)
 
-            cursor.execute("""
-                SELECT name
-                FROM chats
-                WHERE jid LIKE ?
-                LIMIT 1
-            """, (f"%{phone_part}%",))
+            for jid, part in phone_parts.items():
+                names[jid] = chat_names.get(jid) or part_names.get(part)
 
-            result = cursor.fetchone()
+    except sqlite3.Error:
+        logger.exception("Database error while getting sender names")
+        for jid in unresolved:
+            names.setdefault(jid, jid)
+        return names
+
+    # Return just the phone number part if there is no name
+    for jid in unresolved:
+        if not names.get(jid):
+            names[jid] = _phone_from_jid(jid)
+    for jid in unresolved:
+        _sender_name_cache.set(jid, names[jid])
+    return names
 
-        if result and result[0]:
-            return result[0]
-        else:
-            # Return just the phone number part if we have a JID
-            if '@' in sender_jid:
-                return sender_jid.split('@')[0]
-            return sender_jid
+def get_sender_name(sender_jid: str) -> str:
+    """Get display name for a sender JID.
 
-    except sqlite3.Error as e:
-        print(f"Database error while getting sender name: {e}")
-        return sender_jid
-    finally:
-        if 'conn' in locals():
-            conn.close()
+    Looks up contact name from whatsmeow contacts first, then falls back to chats table.
+    """
+    return _resolve_sender_names((sender_jid,))[sender_jid]
 
 def _format_media_label(media_type: str, filename: str = None) -> str:
     """Format a human-readable media type label.
@@ -262,33 +568,41 @@ def _format_media_label(media_type: str, filename: str = None) -> str:
     return f"[{label}]"
 
 
-def format_message(message: Message, show_chat_info: bool = True) -> None:
-    """Print a single message with consistent formatting."""
-    output = ""
+def format_message(message: Message, show_chat_info: bool = True, sender_names: Optional[dict] = None) -> None:
+    """Print a single message with consistent formatting.
 
+    sender_names is an optional mapping of sender JID to display name, as built
+    by _resolve_sender_names; senders missing from it are looked up individually.
+    """
+    def sender_name_for(jid):
+        if sender_names is not None and jid in sender_names:
+            return sender_names[jid]
+        return get_sender_name(jid)
+
+    # Same text as strftime("%Y-%m-%d %H:%M:%S"), without parsing a format spec per message
+    timestamp = message.timestamp.isoformat(" ")[:19]
     if show_chat_info and message.chat_name:
-        output += f"[{message.timestamp:%Y-%m-%d %H:%M:%S}] Chat: {message.chat_name} "
+        header = f"[{timestamp}] Chat: {message.chat_name} "
     else:
-        output += f"[{message.timestamp:%Y-%m-%d %H:%M:%S}] "
+        header = f"[{timestamp}] "
 
     # Build media indicator
     media_indicator = ""
-    if hasattr(message, 'media_type') and message.media_type:
-        filename = getattr(message, 'filename', None)
-        media_indicator = _format_media_label(message.media_type, filename)
+    if message.media_type:
+        media_indicator = _format_media_label(message.media_type, message.filename)
         media_indicator += f" (ID: {message.id}, Chat: {message.chat_jid}) "
 
     # Add reply context if this message is a reply
     reply_info = ""
     if message.reply_to_id:
-        reply_sender = get_sender_name(message.reply_to_sender) if message.reply_to_sender else "Unknown"
+        reply_sender = sender_name_for(message.reply_to_sender) if message.reply_to_sender else "Unknown"
         reply_content = message.reply_to_content or "[message]"
         if len(reply_content) > 50:
             reply_content = reply_content[:50] + "..."
         reply_info = f"[Reply to {reply_sender}: \"{reply_content}\"] "
 
     try:
-        sender_name = get_sender_name(message.sender) if not message.is_from_me else "Me"
+        sender_name = sender_name_for(message.sender) if not message.is_from_me else "Me"
         # Build content: media indicator + caption/text
         content_parts = []
         if media_indicator:
@@ -296,20 +610,338 @@ def format_message(message: Message, show_chat_info: bool = True) -> None:
         if message.content:
             content_parts.append(message.content)
         display_content = " ".join(content_parts) if content_parts else ""
-        output += f"From: {sender_name}: {reply_info}{display_content}\n"
-    except Exception as e:
-        print(f"Error formatting message: {e}")
-    return output
+        return f"{header}From: {sender_name}: {reply_info}{display_content}\n"
+    except Exception:
+        logger.exception("Error formatting message")
+    return header
 
 def format_messages_list(messages: List[Message], show_chat_info: bool = True) -> None:
-    output = ""
     if not messages:
-        output += "No messages to display."
-        return output
+        return "No messages to display."
     
-    for message in messages:
-        output += format_message(message, show_chat_info)
-    return output
+    # Resolve every sender and replied-to sender up front instead of once per message
+    sender_jids = {message.sender for message in messages if not message.is_from_me}
+    sender_jids.update(message.reply_to_sender for message in messages if message.reply_to_id and message.reply_to_sender)
+    sender_names = _resolve_sender_names(sender_jids)
+
+    # One join instead of repeated += so long exports don't copy the output over and over
+    return "".join([format_message(message, show_chat_info, sender_names) for message in messages])
+
+def _encode_cursor(*values) -> str:
+    """Encode the sort key of the last row on a page into an opaque cursor string."""
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode()
+
+
+def _decode_cursor(cursor: str, size: int) -> list:
+    """Decode a cursor produced by _encode_cursor back into its sort key values."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return values
+
+
+def _has_fts_table(cursor: sqlite3.Cursor, name: str) -> bool:
+    """Check whether the bridge has created the named full-text index table.
+
+    Bridges built without FTS5 support never create them, in which case
+    searches fall back to a LIKE scan. Only positive answers are remembered,
+    so an index created after startup is picked up.
+    """
+    if name not in _fts_tables:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,))
+        if cursor.fetchone() is None:
+            return False
+        _fts_tables.add(name)
+    return True
+
+def _has_message_fts(cursor: sqlite3.Cursor) -> bool:
+    """Check whether the messages_fts full-text index exists."""
+    return _has_fts_table(cursor, "messages_fts")
+
+
+def _fts_phrase(query: str) -> str:
+    """Quote a query as a single FTS5 phrase so it is matched literally."""
+    return '"' + query.replace('"', '""') + '"'
+
+
+# Characters and keywords that mark a query as deliberate FTS5 syntax
+_FTS_SYNTAX_CHARS = frozenset('"*():^')
+_FTS_KEYWORDS = frozenset(("AND", "OR", "NOT", "NEAR"))
+
+# Plain search words shorter than this make poor FTS5 prefix terms ("a*" matches
+# nearly everything), so they are checked with LIKE on the FTS candidates instead
+_FTS_MIN_TERM_LENGTH = 3
+
+def _fts_query(query: str) -> Tuple[str, List[str]]:
+    """Translate a search query into an FTS5 MATCH expression.
+
+    Queries that already use FTS5 syntax (quotes, prefix stars, grouping,
+    column filters or AND/OR/NOT/NEAR) are passed through unchanged. Plain
+    text has every word quoted and prefix-matched, so "meet" still finds
+    "meeting" the way the old substring search did. Words shorter than
+    _FTS_MIN_TERM_LENGTH are left out of the expression when longer words
+    remain, and returned separately to be matched as substrings.
+
+    Returns:
+        A tuple of (MATCH expression, short words to filter on separately)
+    """
+    terms = query.split()
+    if _FTS_SYNTAX_CHARS.intersection(query) or _FTS_KEYWORDS.intersection(terms):
+        return query, []
+    long_terms = [term for term in terms if len(term) >= _FTS_MIN_TERM_LENGTH]
+    if not long_terms:
+        return " ".join(_fts_phrase(term) + "*" for term in terms), []
+    short_terms = [term for term in terms if len(term) < _FTS_MIN_TERM_LENGTH]
+    return " ".join(_fts_phrase(term) + "*" for term in long_terms), short_terms
+
+
+def _like_pattern(term: str) -> str:
+    """Build a LIKE '%term%' pattern, escaping wildcards for use with ESCAPE '\\'."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO-8601 string, memoized since clients tend to repeat the same bounds.
+
+    Raises:
+        ValueError: If value is not ISO-8601
+    """
+    return datetime.fromisoformat(value)
+
+# Message columns in Message field order, so rows map positionally onto the dataclass;
+# queries join chats for chats.name. timestamp is row[0], chat_jid row[4] and id row[5]
+_MESSAGE_COLUMNS = "messages.timestamp, messages.sender, messages.content, messages.is_from_me, chats.jid, messages.id, chats.name, messages.media_type, messages.filename, messages.reply_to_id, messages.reply_to_sender, messages.reply_to_content"
+
+def _last_message_join(chat_alias: str) -> str:
+    """Join each chat to its newest message as m.
+
+    The correlated subquery is a single seek on idx_messages_chat_ts per chat,
+    and joining on rowid can never produce more than one row per chat.
+    """
+    return f"""LEFT JOIN messages m ON m.rowid = (
+                        SELECT rowid FROM messages
+                        WHERE chat_jid = {chat_alias}.jid
+                        ORDER BY timestamp DESC, id DESC
+                        LIMIT 1
+                    )"""
+
+# A page's context is fetched in chunks so each statement stays under SQLite's
+# default limit of 500 terms in a compound SELECT (two per target message)
+_CONTEXT_TARGETS_PER_QUERY = 200
+
+def _row_to_message(row: tuple) -> Message:
+    """Build a Message from a row in _MESSAGE_COLUMNS order."""
+    return Message(datetime.fromisoformat(row[0]), *row[1:])
+
+
+def _row_to_chat(row: tuple, contact_names: dict, jid: Optional[str] = None) -> Chat:
+    """Build a Chat from a (jid, name, last_message_time, last_message, last_sender, last_is_from_me) row.
+
+    Individual chats are named from contact_names (as returned by
+    get_contact_names_from_whatsmeow), falling back to the stored name and then
+    the phone number. jid overrides row[0], e.g. with a resolved LID.
+    """
+    jid = jid or row[0]
+    name = row[1]
+    if not jid.endswith("@g.us"):
+        name = contact_names.get(jid) or name or _phone_from_jid(jid)
+    return Chat(
+        jid=jid,
+        name=name,
+        last_message_time=datetime.fromisoformat(row[2]) if row[2] else None,
+        last_message=row[3],
+        last_sender=row[4],
+        last_is_from_me=row[5]
+    )
+
+
+@lru_cache(maxsize=128)
+def _message_query_sql(
+    has_after: bool,
+    has_before: bool,
+    has_sender: bool,
+    has_chat: bool,
+    search: Optional[str],
+    short_term_count: int,
+    has_cursor: bool
+) -> str:
+    """Build the SQL for one combination of list_messages filters.
+
+    Memoized so each query shape is assembled once and the identical string is
+    handed to sqlite3, which keys its prepared statement cache on the SQL text.
+
+    Args:
+        search: "fts" for a messages_fts MATCH, "like" for the LIKE fallback, or None
+        short_term_count: Number of short words filtered with LIKE alongside an FTS match
+    """
+    where_clauses = []
+    if has_after:
+        where_clauses.append("messages.timestamp > ?")
+    if has_before:
+        where_clauses.append("messages.timestamp < ?")
+    if has_sender:
+        where_clauses.append("messages.sender IN (?, ?)")
+    if has_chat:
+        where_clauses.append("messages.chat_jid IN (?, ?)")
+    if search == "fts":
+        # The FTS index covers content, media type and filename so media messages are findable
+        where_clauses.append("messages.rowid IN (SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?)")
+        # Short words narrow the FTS candidates rather than driving the index lookup
+        where_clauses.extend(
+            ["(messages.content LIKE ? ESCAPE '\\' OR messages.filename LIKE ? ESCAPE '\\')"] * short_term_count
+        )
+    elif search == "like":
+        # Search in both content and media type/filename so media messages are findable
+        where_clauses.append("(LOWER(messages.content) LIKE LOWER(?) OR LOWER(messages.media_type) LIKE LOWER(?) OR LOWER(messages.filename) LIKE LOWER(?))")
+    if has_cursor:
+        # Resume strictly after the last row of the previous page
+        where_clauses.append("(messages.timestamp, messages.id) < (?, ?)")
+
+    query_parts = [f"SELECT {_MESSAGE_COLUMNS} FROM messages"]
+    query_parts.append("JOIN chats ON messages.chat_jid = chats.jid")
+    if where_clauses:
+        query_parts.append("WHERE " + " AND ".join(where_clauses))
+    query_parts.append("ORDER BY messages.timestamp DESC, messages.id DESC")
+    query_parts.append("LIMIT ?")
+    return " ".join(query_parts)
+
+
+def _execute_message_query(
+    db_cursor: sqlite3.Cursor,
+    after: Optional[str],
+    before: Optional[str],
+    sender_phone_number: Optional[str],
+    chat_jid: Optional[str],
+    query: Optional[str],
+    cursor: Optional[str],
+    limit: int
+) -> sqlite3.Cursor:
+    """Run the filtered, newest-first message query shared by list_messages and iter_messages.
+
+    Rows are left on db_cursor for the caller to fetch.
+    """
+    params = []
+
+    # Add filters, in the order _message_query_sql places their placeholders
+    if after:
+        try:
+            after = _parse_iso_datetime(after)
+        except ValueError:
+            raise ValueError(f"Invalid date format for 'after': {after}. Please use ISO-8601 format.")
+        params.append(after)
+
+    if before:
+        try:
+            before = _parse_iso_datetime(before)
+        except ValueError:
+            raise ValueError(f"Invalid date format for 'before': {before}. Please use ISO-8601 format.")
+        params.append(before)
+
+    if sender_phone_number:
+        # Resolve LID numbers to phone numbers (sender column stores phone numbers, not LIDs)
+        resolved_sender = sender_phone_number
+        if sender_phone_number.isdigit():
+            lookup = resolve_lid_to_phone(f"{sender_phone_number}@lid")
+            if lookup.endswith('@s.whatsapp.net'):
+                resolved_sender = lookup.split('@')[0]
+        params.extend([sender_phone_number, resolved_sender])
+
+    if chat_jid:
+        # Resolve @lid chat_jid to phone JID
+        resolved_chat_jid = resolve_lid_to_phone(chat_jid) if chat_jid.endswith('@lid') else chat_jid
+        params.extend([chat_jid, resolved_chat_jid])
+
+    search = None
+    short_terms = []
+    fts_param_index = None
+    if query and _has_message_fts(db_cursor):
+        search = "fts"
+        match_expression, short_terms = _fts_query(query)
+        fts_param_index = len(params)
+        params.append(match_expression)
+        for term in short_terms:
+            params.extend([_like_pattern(term), _like_pattern(term)])
+    elif query:
+        search = "like"
+        params.extend([f"%{query}%", f"%{query}%", f"%{query}%"])
+
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor, 2)
+        params.extend([cursor_ts, cursor_id])
+
+    params.append(limit)
+
+    sql = _message_query_sql(
+        bool(after), bool(before), bool(sender_phone_number), bool(chat_jid),
+        search, len(short_terms), bool(cursor)
+    )
+    try:
+        return db_cursor.execute(sql, params)
+    except sqlite3.OperationalError as e:
+        if fts_param_index is None:
+            raise
+        # Most likely not valid FTS5 syntax (e.g. a stray quote, reported as "unterminated string"
+        # rather than an fts5 error), so search for it as a literal phrase
+        params[fts_param_index] = _fts_phrase(query)
+        return db_cursor.execute(sql, params)
+
+
+def _fetch_context_rows(db_cursor: sqlite3.Cursor, targets: list, before: int, after: int) -> Tuple[list, list]:
+    """Fetch the neighbouring messages of every row in a page at once.
+
+    Each target contributes up to two LIMITed range scans on idx_messages_chat_ts,
+    combined with UNION ALL, so a page needs one statement per
+    _CONTEXT_TARGETS_PER_QUERY messages instead of one query per message.
+
+    Args:
+        db_cursor: Cursor to run the queries on
+        targets: (chat_jid, timestamp, id) of each message in the page, timestamps as stored
+        before: Number of messages to fetch before each row
+        after: Number of messages to fetch after each row
+
+    Returns:
+        A tuple of (before_rows, after_rows), lists parallel to targets. Messages
+        before a target are newest first, messages after it oldest first.
+    """
+    before_rows = [[] for _ in targets]
+    after_rows = [[] for _ in targets]
+
+    sides = []
+    if before > 0:
+        sides.append(("<", "DESC", before, before_rows))
+    if after > 0:
+        sides.append((">", "ASC", after, after_rows))
+    if not sides:
+        return before_rows, after_rows
+
+    for start in range(0, len(targets), _CONTEXT_TARGETS_PER_QUERY):
+        branches = []
+        params = []
+        for index in range(start, min(start + _CONTEXT_TARGETS_PER_QUERY, len(targets))):
+            target_chat_jid, target_timestamp, target_id = targets[index]
+            for side, (op, direction, count, _) in enumerate(sides):
+                branches.append(f"""
+                    SELECT * FROM (
+                        SELECT ?, ?, {_MESSAGE_COLUMNS}
+                        FROM messages
+                        JOIN chats ON messages.chat_jid = chats.jid
+                        WHERE messages.chat_jid = ? AND (messages.timestamp, messages.id) {op} (?, ?)
+                        ORDER BY messages.timestamp {direction}, messages.id {direction}
+                        LIMIT ?
+                    )""")
+                params.extend([index, side, target_chat_jid, target_timestamp, target_id, count])
+
+        db_cursor.execute(" UNION ALL ".join(branches), params)
+        for context_row in db_cursor.fetchall():
+            sides[context_row[1]][3][context_row[0]].append(context_row[2:])
+
+    return before_rows, after_rows
+
 
 def list_messages(
     after: Optional[str] = None,
@@ -318,112 +950,95 @@ def list_messages(
     chat_jid: Optional[str] = None,
     query: Optional[str] = None,
     limit: int = 20,
-    page: int = 0,
+    cursor: Optional[str] = None,
     include_context: bool = True,
     context_before: int = 1,
     context_after: int = 1
-) -> List[Message]:
-    """Get messages matching the specified criteria with optional context."""
-    try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-        
-        # Build base query
-        query_parts = ["SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid, messages.id, messages.media_type, messages.filename, messages.reply_to_id, messages.reply_to_sender, messages.reply_to_content FROM messages"]
-        query_parts.append("JOIN chats ON messages.chat_jid = chats.jid")
-        where_clauses = []
-        params = []
+) -> Tuple[str, Optional[str]]:
+    """Get messages matching the specified criteria with optional context.
 
-        # Add filters
-        if after:
-            try:
-                after = datetime.fromisoformat(after)
-            except ValueError:
-                raise ValueError(f"Invalid date format for 'after': {after}. Please use ISO-8601 format.")
+    Results are paged newest first using keyset pagination on (timestamp, id).
+    Pass the returned next_cursor back in to fetch the following page; it is
+    None once there are no more messages.
 
-            where_clauses.append("messages.timestamp > ?")
-            params.append(after)
+    The query is matched against the messages_fts full-text index and accepts
+    FTS5 syntax such as prefix terms (meet*) and phrases ("see you soon").
 
-        if before:
-            try:
-                before = datetime.fromisoformat(before)
-            except ValueError:
-                raise ValueError(f"Invalid date format for 'before': {before}. Please use ISO-8601 format.")
-
-            where_clauses.append("messages.timestamp < ?")
-            params.append(before)
-
-        if sender_phone_number:
-            # Resolve LID numbers to phone numbers (sender column stores phone numbers, not LIDs)
-            resolved_sender = sender_phone_number
-            if sender_phone_number.isdigit():
-                lookup = resolve_lid_to_phone(f"{sender_phone_number}@lid")
-                if lookup.endswith('@s.whatsapp.net'):
-                    resolved_sender = lookup.split('@')[0]
-            where_clauses.append("messages.sender IN (?, ?)")
-            params.extend([sender_phone_number, resolved_sender])
-
-        if chat_jid:
-            # Resolve @lid chat_jid to phone JID
-            resolved_chat_jid = resolve_lid_to_phone(chat_jid) if chat_jid.endswith('@lid') else chat_jid
-            where_clauses.append("messages.chat_jid IN (?, ?)")
-            params.extend([chat_jid, resolved_chat_jid])
-
-        if query:
-            # Search in both content and media type/filename so media messages are findable
-            where_clauses.append("(LOWER(messages.content) LIKE LOWER(?) OR LOWER(messages.media_type) LIKE LOWER(?) OR LOWER(messages.filename) LIKE LOWER(?))")
-            params.extend([f"%{query}%", f"%{query}%", f"%{query}%"])
-
-        if where_clauses:
-            query_parts.append("WHERE " + " AND ".join(where_clauses))
-
-        # Add pagination
-        offset = page * limit
-        query_parts.append("ORDER BY messages.timestamp DESC")
-        query_parts.append("LIMIT ? OFFSET ?")
-        params.extend([limit, offset])
-
-        cursor.execute(" ".join(query_parts), tuple(params))
-        messages = cursor.fetchall()
-
-        result = []
-        for msg in messages:
-            message = Message(
-                timestamp=datetime.fromisoformat(msg[0]),
-                sender=msg[1],
-                chat_name=msg[2],
-                content=msg[3],
-                is_from_me=msg[4],
-                chat_jid=msg[5],
-                id=msg[6],
-                media_type=msg[7],
-                filename=msg[8],
-                reply_to_id=msg[9],
-                reply_to_sender=msg[10],
-                reply_to_content=msg[11]
+    Returns:
+        A tuple of (formatted messages, next_cursor). If the database can't be
+        read, the text is an error message and next_cursor is None.
+    """
+    try:
+        with _messages_pool.acquire() as conn:
+            db_cursor = _execute_message_query(
+                conn.cursor(), after, before, sender_phone_number, chat_jid, query, cursor, limit
             )
-            result.append(message)
+            # Build messages straight off the cursor rather than holding the raw page
+            # as well; only the keys the context query and next cursor need are kept
+            result = []
+            targets = []
+            for row in db_cursor:
+                result.append(_row_to_message(row))
+                targets.append((row[4], row[0], row[5]))
+
+            next_cursor = None
+            if targets and len(targets) == limit:
+                next_cursor = _encode_cursor(targets[-1][1], targets[-1][2])
+
+            if include_context and result:
+                # Add context for each message, fetched for the whole page at once
+                before_rows, after_rows = _fetch_context_rows(conn.cursor(), targets, context_before, context_after)
+                messages_with_context = []
+                for msg, msg_before, msg_after in zip(result, before_rows, after_rows):
+                    messages_with_context.extend(_row_to_message(row) for row in msg_before)
+                    messages_with_context.append(msg)
+                    messages_with_context.extend(_row_to_message(row) for row in msg_after)
             
-        if include_context and result:
-            # Add context for each message
-            messages_with_context = []
-            for msg in result:
-                context = get_message_context(msg.id, context_before, context_after)
-                messages_with_context.extend(context.before)
-                messages_with_context.append(context.message)
-                messages_with_context.extend(context.after)
+                return format_messages_list(messages_with_context, show_chat_info=True), next_cursor
             
-            return format_messages_list(messages_with_context, show_chat_info=True)
-            
-        # Format and display messages without context
-        return format_messages_list(result, show_chat_info=True)    
+            # Format and display messages without context
+            return format_messages_list(result, show_chat_info=True), next_cursor
         
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return []
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.exception("Database error")
+        return f"Error reading messages: {e}", None
+
+
+def iter_messages(
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    sender_phone_number: Optional[str] = None,
+    chat_jid: Optional[str] = None,
+    query: Optional[str] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+    batch_size: int = 256
+) -> Iterator[Tuple[List[Message], str]]:
+    """Yield messages matching the criteria in batches, newest first.
+
+    Rows are pulled from SQLite with fetchmany(batch_size), so only one batch
+    is held in memory at a time. Closing the generator early closes the cursor
+    and returns the connection to the pool.
+
+    Args:
+        Same filters as list_messages, plus batch_size (default 256)
+
+    Yields:
+        (messages, cursor) pairs: up to batch_size Message objects and a cursor
+        that resumes after the last of them
+    """
+    with _messages_pool.acquire() as conn:
+        db_cursor = _execute_message_query(
+            conn.cursor(), after, before, sender_phone_number, chat_jid, query, cursor, limit
+        )
+        try:
+            while True:
+                rows = db_cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [_row_to_message(row) for row in rows], _encode_cursor(rows[-1][0], rows[-1][5])
+        finally:
+            db_cursor.close()
 
 
 def get_message_context(
@@ -431,222 +1046,195 @@ def get_message_context(
     before: int = 5,
     after: int = 5
 ) -> MessageContext:
-    """Get context around a specific message."""
+    """Get context around a specific message.
+
+    The target and its neighbours are fetched in one statement: each side is a
+    LIMITed range scan over idx_messages_chat_ts, seeking from the target's
+    (timestamp, id). The seek values come from scalar subqueries rather than a
+    join so SQLite can walk the index in order instead of sorting the chat.
+    """
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-        
-        # Get the target message first
-        cursor.execute("""
-            SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid, messages.id, messages.chat_jid, messages.media_type, messages.filename, messages.reply_to_id, messages.reply_to_sender, messages.reply_to_content
-            FROM messages
-            JOIN chats ON messages.chat_jid = chats.jid
-            WHERE messages.id = ?
-        """, (message_id,))
-        msg_data = cursor.fetchone()
-
-        if not msg_data:
-            raise ValueError(f"Message with ID {message_id} not found")
-
-        target_message = Message(
-            timestamp=datetime.fromisoformat(msg_data[0]),
-            sender=msg_data[1],
-            chat_name=msg_data[2],
-            content=msg_data[3],
-            is_from_me=msg_data[4],
-            chat_jid=msg_data[5],
-            id=msg_data[6],
-            media_type=msg_data[8],
-            filename=msg_data[9],
-            reply_to_id=msg_data[10],
-            reply_to_sender=msg_data[11],
-            reply_to_content=msg_data[12]
-        )
+        with _messages_pool.acquire() as conn:
+            cursor = conn.cursor()
 
-        # Get messages before
-        cursor.execute("""
-            SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid, messages.id, messages.media_type, messages.filename, messages.reply_to_id, messages.reply_to_sender, messages.reply_to_content
-            FROM messages
-            JOIN chats ON messages.chat_jid = chats.jid
-            WHERE messages.chat_jid = ? AND messages.timestamp < ?
-            ORDER BY messages.timestamp DESC
-            LIMIT ?
-        """, (msg_data[7], msg_data[0], before))
-
-        before_messages = []
-        for msg in cursor.fetchall():
-            before_messages.append(Message(
-                timestamp=datetime.fromisoformat(msg[0]),
-                sender=msg[1],
-                chat_name=msg[2],
-                content=msg[3],
-                is_from_me=msg[4],
-                chat_jid=msg[5],
-                id=msg[6],
-                media_type=msg[7],
-                filename=msg[8],
-                reply_to_id=msg[9],
-                reply_to_sender=msg[10],
-                reply_to_content=msg[11]
-            ))
-
-        # Get messages after
-        cursor.execute("""
-            SELECT messages.timestamp, messages.sender, chats.name, messages.content, messages.is_from_me, chats.jid, messages.id, messages.media_type, messages.filename, messages.reply_to_id, messages.reply_to_sender, messages.reply_to_content
-            FROM messages
-            JOIN chats ON messages.chat_jid = chats.jid
-            WHERE messages.chat_jid = ? AND messages.timestamp > ?
-            ORDER BY messages.timestamp ASC
-            LIMIT ?
-        """, (msg_data[7], msg_data[0], after))
-
-        after_messages = []
-        for msg in cursor.fetchall():
-            after_messages.append(Message(
-                timestamp=datetime.fromisoformat(msg[0]),
-                sender=msg[1],
-                chat_name=msg[2],
-                content=msg[3],
-                is_from_me=msg[4],
-                chat_jid=msg[5],
-                id=msg[6],
-                media_type=msg[7],
-                filename=msg[8],
-                reply_to_id=msg[9],
-                reply_to_sender=msg[10],
-                reply_to_content=msg[11]
-            ))
-        
-        return MessageContext(
-            message=target_message,
-            before=before_messages,
-            after=after_messages
-        )
+            columns = _MESSAGE_COLUMNS
+            cursor.execute(f"""
+                WITH target AS (
+                    SELECT chat_jid, timestamp, id FROM messages WHERE id = ? LIMIT 1
+                )
+                SELECT 0, {columns}
+                FROM target
+                JOIN messages ON messages.chat_jid = target.chat_jid AND messages.id = target.id
+                JOIN chats ON messages.chat_jid = chats.jid
+                UNION ALL
+                SELECT * FROM (
+                    SELECT -1, {columns}
+                    FROM messages
+                    JOIN chats ON messages.chat_jid = chats.jid
+                    WHERE messages.chat_jid = (SELECT chat_jid FROM target)
+                    AND (messages.timestamp, messages.id) < (SELECT timestamp, id FROM target)
+                    ORDER BY messages.timestamp DESC, messages.id DESC
+                    LIMIT ?
+                )
+                UNION ALL
+                SELECT * FROM (
+                    SELECT 1, {columns}
+                    FROM messages
+                    JOIN chats ON messages.chat_jid = chats.jid
+                    WHERE messages.chat_jid = (SELECT chat_jid FROM target)
+                    AND (messages.timestamp, messages.id) > (SELECT timestamp, id FROM target)
+                    ORDER BY messages.timestamp ASC, messages.id ASC
+                    LIMIT ?
+                )
+            """, (message_id, before, after))
+
+            target_message = None
+            before_messages = []
+            after_messages = []
+            for row in cursor.fetchall():
+                message = _row_to_message(row[1:])
+                if row[0] < 0:
+                    before_messages.append(message)
+                elif row[0] > 0:
+                    after_messages.append(message)
+                else:
+                    target_message = message
+
+            if target_message is None:
+                raise ValueError(f"Message with ID {message_id} not found")
+
+            return MessageContext(
+                message=target_message,
+                before=before_messages,
+                after=after_messages
+            )
         
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        logger.warning("Database error: %s", e)
         raise
-    finally:
-        if 'conn' in locals():
-            conn.close()
 
 
 def list_chats(
     query: Optional[str] = None,
     limit: int = 20,
-    page: int = 0,
+    cursor: Optional[str] = None,
     include_last_message: bool = True,
     sort_by: str = "last_active",
     archived: Optional[bool] = None
-) -> List[Chat]:
+) -> Tuple[List[Chat], Optional[str]]:
     """Get chats matching the specified criteria.
 
     Args:
         query: Optional search term to filter chats by name or JID
         limit: Maximum number of chats to return (default 20)
-        page: Page number for pagination (default 0)
+        cursor: Opaque cursor returned by a previous call to fetch the next page (default None)
         include_last_message: Whether to include the last message in each chat (default True)
         sort_by: Field to sort results by, either "last_active" or "name" (default "last_active")
         archived: Optional filter for archived status. None returns all, True returns only archived, False returns only unarchived
-    """
-    try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-
-        # Build base query - only reference messages table when joining
-        if include_last_message:
-            query_parts = ["""
-                SELECT
-                    chats.jid,
-                    chats.name,
-                    chats.last_message_time,
-                    messages.content as last_message,
-                    messages.sender as last_sender,
-                    messages.is_from_me as last_is_from_me
-                FROM chats
-                LEFT JOIN messages ON chats.jid = messages.chat_jid
-                AND chats.last_message_time = messages.timestamp
-            """]
-        else:
-            query_parts = ["""
-                SELECT
-                    chats.jid,
-                    chats.name,
-                    chats.last_message_time,
-                    NULL as last_message,
-                    NULL as last_sender,
-                    NULL as last_is_from_me
-                FROM chats
-            """]
 
-        where_clauses = []
-        params = []
+    Returns:
+        A tuple of (chats, next_cursor). next_cursor is None on the last page.
 
-        # Exclude LID-based chats (they should have been migrated to phone JIDs)
-        where_clauses.append("chats.jid NOT LIKE '%@lid'")
-        # Exclude status broadcast - it's not a real chat
-        where_clauses.append("chats.jid != 'status@broadcast'")
-
-        if query:
-            where_clauses.append("(LOWER(chats.name) LIKE LOWER(?) OR chats.jid LIKE ?)")
-            params.extend([f"%{query}%", f"%{query}%"])
-
-        # Filter by archived status if specified
-        if archived is not None:
-            # Handle case where archived column might not exist yet (returns NULL)
-            # NULL is treated as not archived (0)
-            if archived:
-                where_clauses.append("chats.archived = 1")
+    Raises:
+        sqlite3.Error: If the database can't be read
+    """
+    try:
+        with _messages_pool.acquire() as conn:
+            db_cursor = conn.cursor()
+
+            # Build base query - only reference messages table when joining
+            if include_last_message:
+                query_parts = [f"""
+                    SELECT
+                        chats.jid,
+                        chats.name,
+                        chats.last_message_time,
+                        m.content as last_message,
+                        m.sender as last_sender,
+                        m.is_from_me as last_is_from_me
+                    FROM chats
+                    {_last_message_join("chats")}
+                """]
             else:
-                where_clauses.append("(chats.archived = 0 OR chats.archived IS NULL)")
-
-        if where_clauses:
-            query_parts.append("WHERE " + " AND ".join(where_clauses))
-
-        # Add sorting
-        order_by = "chats.last_message_time DESC" if sort_by == "last_active" else "chats.name"
-        query_parts.append(f"ORDER BY {order_by}")
-
-        # Add pagination
-        offset = (page ) * limit
-        query_parts.append("LIMIT ? OFFSET ?")
-        params.extend([limit, offset])
-
-        cursor.execute(" ".join(query_parts), tuple(params))
-        chats = cursor.fetchall()
-
-        result = []
-        for chat_data in chats:
-            jid = chat_data[0]
-            name = chat_data[1]
-
-            # For individual chats (not groups), try to get contact name from whatsmeow
-            if not jid.endswith("@g.us"):
-                contact_name = get_contact_name_from_whatsmeow(jid)
-                if contact_name:
-                    name = contact_name
-                elif not name:
-                    # If no name found anywhere, use phone number
-                    name = jid.split('@')[0] if '@' in jid else jid
-
-            chat = Chat(
-                jid=jid,
-                name=name,
-                last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
-                last_message=chat_data[3],
-                last_sender=chat_data[4],
-                last_is_from_me=chat_data[5]
+                query_parts = ["""
+                    SELECT
+                        chats.jid,
+                        chats.name,
+                        chats.last_message_time,
+                        NULL as last_message,
+                        NULL as last_sender,
+                        NULL as last_is_from_me
+                    FROM chats
+                """]
+
+            where_clauses = []
+            params = []
+
+            # Exclude LID-based chats (they should have been migrated to phone JIDs)
+            where_clauses.append("chats.jid NOT LIKE '%@lid'")
+            # Exclude status broadcast - it's not a real chat
+            where_clauses.append("chats.jid != 'status@broadcast'")
+
+            if query:
+                where_clauses.append("(LOWER(chats.name) LIKE LOWER(?) OR chats.jid LIKE ?)")
+                params.extend([f"%{query}%", f"%{query}%"])
+
+            # Filter by archived status if specified
+            if archived is not None:
+                # Handle case where archived column might not exist yet (returns NULL)
+                # NULL is treated as not archived (0)
+                if archived:
+                    where_clauses.append("chats.archived = 1")
+                else:
+                    where_clauses.append("(chats.archived = 0 OR chats.archived IS NULL)")
+
+            # Keyset pagination: the sort key always ends in the unique jid so pages never overlap
+            if sort_by == "last_active":
+                sort_key = "IFNULL(chats.last_message_time, '')"
+                order_by = f"{sort_key} DESC, chats.jid DESC"
+                seek_op = "<"
+            else:
+                # Case-insensitive, matching the bridge's idx_chats_name_nocase expression index
+                sort_key = "IFNULL(chats.name, '') COLLATE NOCASE"
+                order_by = f"{sort_key}, chats.jid"
+                seek_op = ">"
+
+            if cursor:
+                cursor_key, cursor_jid = _decode_cursor(cursor, 2)
+                where_clauses.append(f"({sort_key}, chats.jid) {seek_op} (?, ?)")
+                params.extend([cursor_key, cursor_jid])
+
+            if where_clauses:
+                query_parts.append("WHERE " + " AND ".join(where_clauses))
+
+            # Add sorting
+            query_parts.append(f"ORDER BY {order_by}")
+
+            # Add pagination
+            query_parts.append("LIMIT ?")
+            params.append(limit)
+
+            db_cursor.execute(" ".join(query_parts), tuple(params))
+            chats = db_cursor.fetchall()
+
+            next_cursor = None
+            if chats and len(chats) == limit:
+                last = chats[-1]
+                last_key = last[2] if sort_by == "last_active" else last[1]
+                next_cursor = _encode_cursor(last_key or '', last[0])
+
+            # For individual chats (not groups), try to get contact names from whatsmeow
+            contact_names = get_contact_names_from_whatsmeow(
+                chat_data[0] for chat_data in chats if not chat_data[0].endswith("@g.us")
             )
-            result.append(chat)
 
-        return result
+            result = [_row_to_chat(chat_data, contact_names) for chat_data in chats]
+
+            return result, next_cursor
 
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return []
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error: %s", e)
+        raise
 
 
 def search_contacts(query: str) -> List[Contact]:
@@ -654,6 +1242,7 @@ def search_contacts(query: str) -> List[Contact]:
 
     Searches both the chats table and whatsmeow contacts for matching contacts.
     For @lid contacts, resolves to phone-JID equivalent and dedupes.
+    Database errors are raised rather than returning a partial list.
     """
     result = []
     seen_jids = set()
@@ -662,391 +1251,342 @@ def search_contacts(query: str) -> List[Contact]:
 
     # First, search whatsmeow contacts (more accurate names)
     try:
-        conn = sqlite3.connect(WHATSMEOW_DB_PATH)
-        cursor = conn.cursor()
-
-        search_pattern = f'%{query}%'
-
-        cursor.execute("""
-            SELECT DISTINCT
-                their_jid,
-                full_name,
-                push_name,
-                business_name
-            FROM whatsmeow_contacts
-            WHERE
-                (LOWER(full_name) LIKE LOWER(?) OR
-                 LOWER(push_name) LIKE LOWER(?) OR
-                 LOWER(business_name) LIKE LOWER(?) OR
-                 their_jid LIKE ?)
-                AND their_jid NOT LIKE '%@g.us'
-            ORDER BY full_name, push_name, their_jid
-            LIMIT 50
-        """, (search_pattern, search_pattern, search_pattern, search_pattern))
-
-        contacts = cursor.fetchall()
-
-        for contact_data in contacts:
-            jid = contact_data[0]
-            full_name, push_name, business_name = contact_data[1], contact_data[2], contact_data[3]
-            name = full_name or push_name or business_name
-
-            # If this is a @lid contact, resolve to phone JID so callers can use it for chat lookups
-            display_jid = jid
-            if jid.endswith('@lid'):
-                resolved = resolve_lid_to_phone(jid)
-                if resolved != jid and resolved.endswith('@s.whatsapp.net'):
-                    display_jid = resolved
-                    lid_resolutions[jid] = resolved
-
-            if display_jid not in seen_jids:
-                contact = Contact(
-                    phone_number=display_jid.split('@')[0] if '@' in display_jid else display_jid,
-                    name=name,
-                    jid=display_jid
-                )
-                result.append(contact)
-                seen_jids.add(display_jid)
-                # Also mark the original LID so subsequent rows for the same phone are skipped
-                if display_jid != jid:
-                    seen_jids.add(jid)
+        with _whatsmeow_pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            search_pattern = f'%{query}%'
+
+            cursor.execute("""
+                SELECT DISTINCT
+                    their_jid,
+                    full_name,
+                    push_name,
+                    business_name
+                FROM whatsmeow_contacts
+                WHERE
+                    substr(their_jid, -5) != '@g.us'
+                    AND (LOWER(full_name) LIKE LOWER(?) OR
+                     LOWER(push_name) LIKE LOWER(?) OR
+                     LOWER(business_name) LIKE LOWER(?) OR
+                     their_jid LIKE ?)
+                ORDER BY full_name, push_name, their_jid
+                LIMIT 50
+            """, (search_pattern, search_pattern, search_pattern, search_pattern))
+
+            contacts = cursor.fetchall()
+
+            for contact_data in contacts:
+                jid = contact_data[0]
+                full_name, push_name, business_name = contact_data[1], contact_data[2], contact_data[3]
+                name = full_name or push_name or business_name
+
+                # If this is a @lid contact, resolve to phone JID so callers can use it for chat lookups
+                display_jid = jid
+                if jid.endswith('@lid'):
+                    resolved = resolve_lid_to_phone(jid)
+                    if resolved != jid and resolved.endswith('@s.whatsapp.net'):
+                        display_jid = resolved
+                        lid_resolutions[jid] = resolved
+
+                if display_jid not in seen_jids:
+                    contact = Contact(
+                        phone_number=_phone_from_jid(display_jid),
+                        name=name,
+                        jid=display_jid
+                    )
+                    result.append(contact)
+                    seen_jids.add(display_jid)
+                    # Also mark the original LID so subsequent rows for the same phone are skipped
+                    if display_jid != jid:
+                        seen_jids.add(jid)
 
     except sqlite3.Error as e:
-        print(f"Database error while searching whatsmeow contacts: {e}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error while searching whatsmeow contacts: %s", e)
+        raise
 
     # Then search chats table for any additional contacts
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-
-        search_pattern = f'%{query}%'
-
-        cursor.execute("""
-            SELECT DISTINCT
-                jid,
-                name
-            FROM chats
-            WHERE
-                (LOWER(name) LIKE LOWER(?) OR LOWER(jid) LIKE LOWER(?))
-                AND jid NOT LIKE '%@g.us'
-            ORDER BY name, jid
-            LIMIT 50
-        """, (search_pattern, search_pattern))
-
-        contacts = cursor.fetchall()
-
-        for contact_data in contacts:
-            jid = contact_data[0]
-            if jid not in seen_jids:
-                # Try to get contact name from whatsmeow first
-                name = get_contact_name_from_whatsmeow(jid) or contact_data[1]
-                if not name:
-                    name = jid.split('@')[0] if '@' in jid else jid
-
-                contact = Contact(
-                    phone_number=jid.split('@')[0] if '@' in jid else jid,
-                    name=name,
-                    jid=jid
-                )
-                result.append(contact)
-                seen_jids.add(jid)
+        with _messages_pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            if len(query) >= 3 and _has_fts_table(cursor, "chats_fts"):
+                # Trigram index: a quoted query matches as a case-insensitive substring of name or jid
+                match_clause = "rowid IN (SELECT rowid FROM chats_fts WHERE chats_fts MATCH ?)"
+                search_params = (_fts_phrase(query),)
+            else:
+                # Trigrams need at least three characters, so shorter queries scan with LIKE
+                search_pattern = f'%{query}%'
+                match_clause = "(LOWER(name) LIKE LOWER(?) OR LOWER(jid) LIKE LOWER(?))"
+                search_params = (search_pattern, search_pattern)
+
+            cursor.execute(f"""
+                SELECT DISTINCT
+                    jid,
+                    name
+                FROM chats
+                WHERE
+                    substr(jid, -5) != '@g.us'
+                    AND {match_clause}
+                ORDER BY name, jid
+                LIMIT 50
+            """, search_params)
+
+            contacts = [contact_data for contact_data in cursor.fetchall() if contact_data[0] not in seen_jids]
+
+            # Try to get contact names from whatsmeow first
+            contact_names = get_contact_names_from_whatsmeow(contact_data[0] for contact_data in contacts)
+
+            for contact_data in contacts:
+                jid = contact_data[0]
+                if jid not in seen_jids:
+                    name = contact_names[jid] or contact_data[1]
+                    if not name:
+                        name = _phone_from_jid(jid)
+
+                    contact = Contact(
+                        phone_number=_phone_from_jid(jid),
+                        name=name,
+                        jid=jid
+                    )
+                    result.append(contact)
+                    seen_jids.add(jid)
 
     except sqlite3.Error as e:
-        print(f"Database error while searching chats: {e}")
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error while searching chats: %s", e)
+        raise
 
     return result
 
 
-def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> List[Chat]:
+def get_contact_chats(jid: str, limit: int = 20, cursor: Optional[str] = None) -> Tuple[List[Chat], Optional[str]]:
     """Get all chats involving the contact.
 
     Args:
         jid: The contact's JID to search for
         limit: Maximum number of chats to return (default 20)
-        page: Page number for pagination (default 0)
+        cursor: Opaque cursor returned by a previous call to fetch the next page (default None)
+
+    Returns:
+        A tuple of (chats, next_cursor). next_cursor is None on the last page.
+
+    Raises:
+        sqlite3.Error: If the database can't be read
     """
     # Resolve @lid JIDs to phone JIDs since chats are keyed by @s.whatsapp.net
     resolved_jid = resolve_lid_to_phone(jid) if jid.endswith('@lid') else jid
 
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-
-        # Match both original and resolved JID (covers either form being stored)
-        cursor.execute("""
-            SELECT DISTINCT
-                c.jid,
-                c.name,
-                c.last_message_time,
-                m.content as last_message,
-                m.sender as last_sender,
-                m.is_from_me as last_is_from_me
-            FROM chats c
-            JOIN messages m ON c.jid = m.chat_jid
-            WHERE m.sender IN (?, ?) OR c.jid IN (?, ?)
-            ORDER BY c.last_message_time DESC
-            LIMIT ? OFFSET ?
-        """, (jid, resolved_jid, jid, resolved_jid, limit, page * limit))
-        
-        chats = cursor.fetchall()
-
-        result = []
-        for chat_data in chats:
-            chat_jid = chat_data[0]
-            name = chat_data[1]
-
-            # For individual chats (not groups), try to get contact name from whatsmeow
-            if not chat_jid.endswith("@g.us"):
-                contact_name = get_contact_name_from_whatsmeow(chat_jid)
-                if contact_name:
-                    name = contact_name
-                elif not name:
-                    name = chat_jid.split('@')[0] if '@' in chat_jid else chat_jid
-
-            chat = Chat(
-                jid=chat_jid,
-                name=name,
-                last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
-                last_message=chat_data[3],
-                last_sender=chat_data[4],
-                last_is_from_me=chat_data[5]
+        with _messages_pool.acquire() as conn:
+            db_cursor = conn.cursor()
+
+            # Match both original and resolved JID (covers either form being stored).
+            # EXISTS keeps one row per chat instead of one per matching message.
+            params = [jid, resolved_jid, jid, resolved_jid]
+            seek_clause = ""
+            if cursor:
+                cursor_ts, cursor_jid = _decode_cursor(cursor, 2)
+                seek_clause = "AND (IFNULL(c.last_message_time, ''), c.jid) < (?, ?)"
+                params.extend([cursor_ts, cursor_jid])
+            params.append(limit)
+
+            db_cursor.execute(f"""
+                SELECT
+                    c.jid,
+                    c.name,
+                    c.last_message_time,
+                    m.content as last_message,
+                    m.sender as last_sender,
+                    m.is_from_me as last_is_from_me
+                FROM chats c
+                {_last_message_join("c")}
+                WHERE (c.jid IN (?, ?) OR EXISTS (
+                    SELECT 1 FROM messages s
+                    WHERE s.chat_jid = c.jid AND s.sender IN (?, ?)
+                ))
+                {seek_clause}
+                ORDER BY IFNULL(c.last_message_time, '') DESC, c.jid DESC
+                LIMIT ?
+            """, tuple(params))
+
+            chats = db_cursor.fetchall()
+
+            next_cursor = None
+            if chats and len(chats) == limit:
+                next_cursor = _encode_cursor(chats[-1][2] or '', chats[-1][0])
+
+            # For individual chats (not groups), try to get contact names from whatsmeow
+            contact_names = get_contact_names_from_whatsmeow(
+                chat_data[0] for chat_data in chats if not chat_data[0].endswith("@g.us")
             )
-            result.append(chat)
 
-        return result
+            return [_row_to_chat(chat_data, contact_names) for chat_data in chats], next_cursor
 
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return []
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error: %s", e)
+        raise
 
 
-def get_last_interaction(jid: str) -> str:
-    """Get most recent message involving the contact."""
+def get_last_interaction(jid: str) -> Optional[str]:
+    """Get most recent message involving the contact, or None if there is none; raises sqlite3.Error if the database can't be read."""
     # Resolve @lid JIDs to phone JIDs since chats are keyed by @s.whatsapp.net
     resolved_jid = resolve_lid_to_phone(jid) if jid.endswith('@lid') else jid
 
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT
-                m.timestamp,
-                m.sender,
-                c.name,
-                m.content,
-                m.is_from_me,
-                c.jid,
-                m.id,
-                m.media_type,
-                m.filename,
-                m.reply_to_id,
-                m.reply_to_sender,
-                m.reply_to_content
-            FROM messages m
-            JOIN chats c ON m.chat_jid = c.jid
-            WHERE m.sender IN (?, ?) OR c.jid IN (?, ?)
-            ORDER BY m.timestamp DESC
-            LIMIT 1
-        """, (jid, resolved_jid, jid, resolved_jid))
-
-        msg_data = cursor.fetchone()
-
-        if not msg_data:
-            return None
+        with _messages_pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(f"""
+                SELECT {_MESSAGE_COLUMNS}
+                FROM messages
+                JOIN chats ON messages.chat_jid = chats.jid
+                WHERE messages.sender IN (?, ?) OR chats.jid IN (?, ?)
+                ORDER BY messages.timestamp DESC
+                LIMIT 1
+            """, (jid, resolved_jid, jid, resolved_jid))
 
-        message = Message(
-            timestamp=datetime.fromisoformat(msg_data[0]),
-            sender=msg_data[1],
-            chat_name=msg_data[2],
-            content=msg_data[3],
-            is_from_me=msg_data[4],
-            chat_jid=msg_data[5],
-            id=msg_data[6],
-            media_type=msg_data[7],
-            filename=msg_data[8],
-            reply_to_id=msg_data[9],
-            reply_to_sender=msg_data[10],
-            reply_to_content=msg_data[11]
-        )
+            msg_data = cursor.fetchone()
+
+            if not msg_data:
+                return None
+
+            message = _row_to_message(msg_data)
 
-        return format_message(message)
+            return format_message(message)
         
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return None
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error: %s", e)
+        raise
+
+
+def _select_chat(
+    cursor: sqlite3.Cursor,
+    where_sql: str,
+    params: tuple,
+    include_last_message: bool = True,
+    order_sql: Optional[str] = None
+) -> Optional[tuple]:
+    """Fetch the first chats row (aliased c) matching where_sql, with its newest message.
+
+    get_chat and get_direct_chat_by_contact share this SELECT, so each caller
+    only varies the WHERE/ORDER BY and reuses one cached prepared statement.
+
+    Returns:
+        (jid, name, last_message_time, last_message, last_sender, last_is_from_me),
+        or None if no chat matches
+    """
+    if include_last_message:
+        columns = "m.content, m.sender, m.is_from_me"
+        join = _last_message_join("c")
+    else:
+        columns = "NULL, NULL, NULL"
+        join = ""
+    query = f"SELECT c.jid, c.name, c.last_message_time, {columns} FROM chats c {join} WHERE {where_sql}"
+    if order_sql:
+        query += f" ORDER BY {order_sql}"
+    cursor.execute(query + " LIMIT 1", params)
+    return cursor.fetchone()
 
 
 def get_chat(chat_jid: str, include_last_message: bool = True) -> Optional[Chat]:
-    """Get chat metadata by JID."""
+    """Get chat metadata by JID; raises sqlite3.Error if the database can't be read."""
     # Resolve @lid JIDs to phone JIDs since chats are keyed by @s.whatsapp.net
     if chat_jid.endswith('@lid'):
         chat_jid = resolve_lid_to_phone(chat_jid)
 
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
+        with _messages_pool.acquire() as conn:
+            cursor = conn.cursor()
 
-        if include_last_message:
-            query = """
-                SELECT
-                    c.jid,
-                    c.name,
-                    c.last_message_time,
-                    m.content as last_message,
-                    m.sender as last_sender,
-                    m.is_from_me as last_is_from_me
-                FROM chats c
-                LEFT JOIN messages m ON c.jid = m.chat_jid
-                AND c.last_message_time = m.timestamp
-            """
-        else:
-            query = """
-                SELECT
-                    c.jid,
-                    c.name,
-                    c.last_message_time,
-                    NULL as last_message,
-                    NULL as last_sender,
-                    NULL as last_is_from_me
-                FROM chats c
-            """
-
-        query += " WHERE c.jid = ?"
+            chat_data = _select_chat(cursor, "c.jid = ?", (chat_jid,), include_last_message)
 
-        cursor.execute(query, (chat_jid,))
-        chat_data = cursor.fetchone()
-
-        if not chat_data:
-            return None
+            if not chat_data:
+                return None
 
-        jid = chat_data[0]
-        name = chat_data[1]
-
-        # For individual chats (not groups), try to get contact name from whatsmeow
-        if not jid.endswith("@g.us"):
-            contact_name = get_contact_name_from_whatsmeow(jid)
-            if contact_name:
-                name = contact_name
-            elif not name:
-                name = jid.split('@')[0] if '@' in jid else jid
-
-        return Chat(
-            jid=jid,
-            name=name,
-            last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
-            last_message=chat_data[3],
-            last_sender=chat_data[4],
-            last_is_from_me=chat_data[5]
-        )
+            # For individual chats (not groups), try to get contact name from whatsmeow
+            jid = chat_data[0]
+            contact_names = {} if jid.endswith("@g.us") else get_contact_names_from_whatsmeow((jid,))
+            return _row_to_chat(chat_data, contact_names)
 
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return None
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error: %s", e)
+        raise
 
 
 def get_direct_chat_by_contact(sender_phone_number: str) -> Optional[Chat]:
-    """Get chat metadata by sender phone number."""
+    """Get chat metadata by sender phone number; raises sqlite3.Error if the database can't be read."""
     try:
-        conn = sqlite3.connect(MESSAGES_DB_PATH)
-        cursor = conn.cursor()
-
-        # Prefer phone-number JIDs over LID JIDs by ordering @s.whatsapp.net first
-        cursor.execute("""
-            SELECT
-                c.jid,
-                c.name,
-                c.last_message_time,
-                m.content as last_message,
-                m.sender as last_sender,
-                m.is_from_me as last_is_from_me
-            FROM chats c
-            LEFT JOIN messages m ON c.jid = m.chat_jid
-                AND c.last_message_time = m.timestamp
-            WHERE c.jid LIKE ? AND c.jid NOT LIKE '%@g.us'
-            ORDER BY CASE WHEN c.jid LIKE '%@s.whatsapp.net' THEN 0 ELSE 1 END
-            LIMIT 1
-        """, (f"%{sender_phone_number}%",))
-
-        chat_data = cursor.fetchone()
-
-        if not chat_data:
-            return None
+        with _messages_pool.acquire() as conn:
+            cursor = conn.cursor()
+
+            # Prefer phone-number JIDs over LID JIDs by ordering @s.whatsapp.net first
+            chat_data = _select_chat(
+                cursor,
+                f"{_CHAT_PHONE_SQL} = ? AND substr(c.jid, -5) != '@g.us'",
+                (_phone_from_jid(sender_phone_number),),
+                order_sql="CASE WHEN substr(c.jid, -15) = '@s.whatsapp.net' THEN 0 ELSE 1 END"
+            )
 
-        jid = chat_data[0]
-        name = chat_data[1]
+            if not chat_data:
+                return None
 
-        # If we got a LID chat, resolve it to the phone JID for display
-        if jid.endswith('@lid'):
-            resolved = resolve_lid_to_phone(jid)
-            if resolved != jid:
-                jid = resolved
+            jid = chat_data[0]
 
-        # Try to get contact name from whatsmeow
-        contact_name = get_contact_name_from_whatsmeow(jid)
-        if contact_name:
-            name = contact_name
-        elif not name:
-            name = jid.split('@')[0] if '@' in jid else jid
-
-        return Chat(
-            jid=jid,
-            name=name,
-            last_message_time=datetime.fromisoformat(chat_data[2]) if chat_data[2] else None,
-            last_message=chat_data[3],
-            last_sender=chat_data[4],
-            last_is_from_me=chat_data[5]
-        )
+            # If we got a LID chat, resolve it to the phone JID for display
+            if jid.endswith('@lid'):
+                resolved = resolve_lid_to_phone(jid)
+                if resolved != jid:
+                    jid = resolved
+
+            # Try to get contact name from whatsmeow
+            return _row_to_chat(chat_data, get_contact_names_from_whatsmeow((jid,)), jid)
 
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
-        return None
-    finally:
-        if 'conn' in locals():
-            conn.close()
+        logger.warning("Database error: %s", e)
+        raise
 
-def send_message(recipient: str, message: str) -> Tuple[bool, str]:
-    try:
-        # Validate input
-        if not recipient:
-            return False, "Recipient must be provided"
-
-        url = f"{WHATSAPP_API_BASE_URL}/send"
-        payload = {
-            "recipient": recipient,
-            "message": message,
-        }
+def build_send_payload(recipient: str, message: str, reply_to_id: Optional[str] = None, reply_to_jid: Optional[str] = None) -> dict:
+    """Build the request body the bridge's /send endpoint expects for a text message or reply."""
+    payload = {
+        "recipient": recipient,
+        "message": message,
+    }
+    if reply_to_id:
+        payload["reply_to_id"] = reply_to_id
+        payload["reply_to_jid"] = reply_to_jid
+    return payload
 
-        response = requests.post(url, json=payload)
 
-        # Check if the request was successful
-        if response.status_code == 200:
-            result = response.json()
-            return result.get("success", False), result.get("message", "Unknown response")
-        else:
-            return False, f"Error: HTTP {response.status_code} - {response.text}"
+def _media_payload(recipient: str, media_path: str = "", media_data: Union[str, bytes] = "", filename: str = "") -> dict:
+    """Build the /send body for a media message.
 
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response: {response.text}"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    Priority: media_data > media_url > media_path. Raw bytes in media_data are
+    base64-encoded here so callers holding the file contents don't build the
+    string themselves. URLs are downloaded by the bridge; any other media_path
+    is read by the bridge from its own filesystem.
+    """
+    payload = {"recipient": recipient}
+    if media_data:
+        if isinstance(media_data, (bytes, bytearray, memoryview)):
+            media_data = base64.b64encode(media_data).decode("ascii")
+        payload["media_data"] = media_data
+        if filename:
+            payload["filename"] = filename
+    elif media_path.startswith(_HTTP_SCHEMES):
+        payload["media_url"] = media_path
+    else:
+        payload["media_path"] = media_path
+    return payload
+
+
+def send_message(recipient: str, message: str) -> Tuple[bool, str]:
+    # Validate input
+    if not recipient:
+        return False, "Recipient must be provided"
+
+    payload = build_send_payload(recipient, message)
+
+    success, status_message, _ = _call_bridge("POST", _URL_SEND, payload)
+    return success, status_message
 
 
 def send_reply(recipient: str, message: str, reply_to_id: str, reply_to_jid: str) -> Tuple[bool, str]:
@@ -1061,38 +1601,44 @@ def send_reply(recipient: str, message: str, reply_to_id: str, reply_to_jid: str
     Returns:
         Tuple of (success, status_message)
     """
-    try:
-        # Validate input
-        if not recipient:
-            return False, "Recipient must be provided"
-        if not reply_to_id:
-            return False, "reply_to_id must be provided"
-
-        url = f"{WHATSAPP_API_BASE_URL}/send"
-        payload = {
-            "recipient": recipient,
-            "message": message,
-            "reply_to_id": reply_to_id,
-            "reply_to_jid": reply_to_jid,
-        }
+    # Validate input
+    if not recipient:
+        return False, "Recipient must be provided"
+    if not reply_to_id:
+        return False, "reply_to_id must be provided"
 
-        response = requests.post(url, json=payload)
+    payload = build_send_payload(recipient, message, reply_to_id, reply_to_jid)
 
-        # Check if the request was successful
-        if response.status_code == 200:
-            result = response.json()
-            return result.get("success", False), result.get("message", "Unknown response")
-        else:
-            return False, f"Error: HTTP {response.status_code} - {response.text}"
+    success, status_message, _ = _call_bridge("POST", _URL_SEND, payload)
+    return success, status_message
 
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response: {response.text}"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+def send_batch(payloads: List[dict]) -> List[Tuple[bool, str]]:
+    """Send several messages in one request to the bridge.
+
+    A single payload is posted to /send so it takes the same path as send_message.
+
+    Args:
+        payloads: Request bodies as built by build_send_payload
 
-def send_file(recipient: str, media_path: str = "", media_data: str = "", filename: str = "") -> Tuple[bool, str]:
+    Returns:
+        One (success, status_message) tuple per payload, in the same order
+    """
+    if len(payloads) == 1:
+        payload = payloads[0]
+        if payload.get("reply_to_id"):
+            return [send_reply(payload["recipient"], payload["message"], payload["reply_to_id"], payload.get("reply_to_jid", ""))]
+        return [send_message(payload["recipient"], payload["message"])]
+
+    success, status_message, result = _call_bridge("POST", _URL_SEND_BATCH, {"messages": payloads})
+    if result is None:
+        return [(False, status_message)] * len(payloads)
+    return [
+        (item.get("success", False), item.get("message", "Unknown response"))
+        for item in result.get("results", [])
+    ]
+
+
+def send_file(recipient: str, media_path: str = "", media_data: Union[str, bytes] = "", filename: str = "") -> Tuple[bool, str]:
     """Send a file via WhatsApp.
 
     Priority order:
@@ -1103,61 +1649,34 @@ def send_file(recipient: str, media_path: str = "", media_data: str = "", filena
     Args:
         recipient: Phone number or JID
         media_path: URL or container-accessible file path
-        media_data: Base64-encoded file data (takes priority)
+        media_data: Base64-encoded file data, or the raw file bytes (takes priority)
         filename: Original filename (required with media_data)
 
     Returns:
         Tuple of (success, message)
     """
-    try:
-        # Validate input
-        if not recipient:
-            return False, "Recipient must be provided"
-
-        if not media_path and not media_data:
-            return False, "Either media_path (URL or path) or media_data (base64) must be provided"
-
-        url = f"{WHATSAPP_API_BASE_URL}/send"
-        payload = {"recipient": recipient}
-
-        # Priority: media_data > media_url > media_path
-        if media_data:
-            # Base64 data provided - highest priority
-            payload["media_data"] = media_data
-            if filename:
-                payload["filename"] = filename
-        elif media_path.startswith("http://") or media_path.startswith("https://"):
-            # It's a URL - send via media_url parameter
-            payload["media_url"] = media_path
-        else:
-            # It's a local path - check if accessible before sending
-            if not os.path.isfile(media_path):
-                # File not found - provide helpful guidance
-                return False, (
-                    f"Media file not found: {media_path}. "
-                    "This MCP runs in a container and cannot access host filesystem paths. "
-                    "Please use one of these alternatives:\n"
-                    "1. media_data: Pass base64-encoded file content (recommended)\n"
-                    "2. media_path with URL: Provide an http:// or https:// URL\n"
-                    "3. Container path: Use paths under /app/store/ (mounted volume)"
-                )
-            payload["media_path"] = media_path
-
-        response = requests.post(url, json=payload)
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            result = response.json()
-            return result.get("success", False), result.get("message", "Unknown response")
-        else:
-            return False, f"Error: HTTP {response.status_code} - {response.text}"
+    # Validate input
+    if not recipient:
+        return False, "Recipient must be provided"
+
+    if not media_path and not media_data:
+        return False, "Either media_path (URL or path) or media_data (base64) must be provided"
+
+    # A local path must be visible here too, since the bridge shares this container's store
+    if not media_data and not media_path.startswith(_HTTP_SCHEMES) and not os.path.isfile(media_path):
+        # File not found - provide helpful guidance
+        return False, (
+            f"Media file not found: {media_path}. "
+            "This MCP runs in a container and cannot access host filesystem paths. "
+            "Please use one of these alternatives:\n"
+            "1. media_data: Pass base64-encoded file content (recommended)\n"
+            "2. media_path with URL: Provide an http:// or https:// URL\n"
+            "3. Container path: Use paths under /app/store/ (mounted volume)"
+        )
 
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response: {response.text}"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    payload = _media_payload(recipient, media_path, media_data, filename)
+    success, status_message, _ = _call_bridge("POST", _URL_SEND, payload)
+    return success, status_message
 
 def send_audio_message(recipient: str, media_path: str) -> Tuple[bool, str]:
     """Send an audio file as a WhatsApp voice message.
@@ -1177,57 +1696,35 @@ def send_audio_message(recipient: str, media_path: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    try:
-        # Validate input
-        if not recipient:
-            return False, "Recipient must be provided"
-
-        if not media_path:
-            return False, "Media path or URL must be provided"
-
-        url = f"{WHATSAPP_API_BASE_URL}/send"
-
-        # Check if media_path is a URL or a local path
-        if media_path.startswith("http://") or media_path.startswith("https://"):
-            # It's a URL - send via media_url parameter
-            # For URLs, we assume the file is already in the correct format
-            payload = {
-                "recipient": recipient,
-                "media_url": media_path
-            }
-        else:
-            # It's a local path
-            # Check if the file exists locally and can be converted
-            if os.path.isfile(media_path):
-                if not media_path.endswith(".ogg"):
-                    try:
-                        media_path = audio.convert_to_opus_ogg_temp(media_path)
-                    except Exception as e:
-                        return False, f"Error converting file to opus ogg. You likely need to install ffmpeg: {str(e)}"
-
-            # Send via media_path parameter - Go bridge will read the file
-            payload = {
-                "recipient": recipient,
-                "media_path": media_path
-            }
-
-        response = requests.post(url, json=payload)
-
-        # Check if the request was successful
-        if response.status_code == 200:
-            result = response.json()
-            return result.get("success", False), result.get("message", "Unknown response")
-        else:
-            return False, f"Error: HTTP {response.status_code} - {response.text}"
-
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response: {response.text}"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
-
-@dataclass
+    # Validate input
+    if not recipient:
+        return False, "Recipient must be provided"
+
+    if not media_path:
+        return False, "Media path or URL must be provided"
+
+    # URLs are downloaded by the bridge as is, so they must already be Opus in Ogg
+    if not media_path.startswith(_HTTP_SCHEMES):
+        # It's a local path
+        # Convert it if it exists locally and isn't Opus in Ogg already (e.g. a
+        # .opus or .oga voice note); the one stat is handed to the converter so its
+        # cache lookup doesn't repeat it
+        if os.path.splitext(media_path)[1].lower() != ".ogg":
+            try:
+                media_stat = os.stat(media_path)
+            except OSError:
+                media_stat = None
+            if (media_stat is not None and stat.S_ISREG(media_stat.st_mode)
+                    and not audio.is_opus_ogg(media_path)):
+                try:
+                    media_path = audio.convert_to_opus_ogg_cached(media_path, input_stat=media_stat)
+                except Exception as e:
+                    return False, f"Error converting file to opus ogg. You likely need to install ffmpeg: {str(e)}"
+
+    success, status_message, _ = _call_bridge("POST", _URL_SEND, _media_payload(recipient, media_path))
+    return success, status_message
+
+@dataclass(slots=True, frozen=True)
 class DownloadedMedia:
     success: bool
     message: str
@@ -1256,79 +1753,46 @@ def download_media(message_id: str, chat_jid: str) -> dict:
         - media_type: Type of media (image, video, audio, document)
         - access_note: Instructions for accessing the media
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/download"
-        payload = {
-            "message_id": message_id,
-            "chat_jid": chat_jid
-        }
-
-        response = requests.post(url, json=payload)
-
-        if response.status_code == 200:
-            result = response.json()
-            if result.get("success", False):
-                path = result.get("path")
-                filename = result.get("filename")
-                media_url = result.get("media_url")  # Relative URL path
-                public_url = result.get("public_url")  # Full public URL from bridge
-                media_type = result.get("media_type")
-                access_note = result.get("access_note")
-
-                print(f"Media downloaded successfully: {path}")
-                print(f"Public URL: {public_url}")
-                print(f"Access note: {access_note}")
-
-                return {
-                    "success": True,
-                    "message": f"Successfully downloaded {media_type} media",
-                    "filename": filename,
-                    "path": path,
-                    "public_url": public_url,
-                    "media_type": media_type,
-                    "access_note": access_note
-                }
-            else:
-                error_msg = result.get('message', 'Unknown error')
-                print(f"Download failed: {error_msg}")
-                return {
-                    "success": False,
-                    "message": f"Download failed: {error_msg}"
-                }
-        else:
-            error_msg = f"HTTP {response.status_code} - {response.text}"
-            print(f"Error: {error_msg}")
-            return {
-                "success": False,
-                "message": f"Error: {error_msg}"
-            }
+    payload = {
+        "message_id": message_id,
+        "chat_jid": chat_jid
+    }
 
-    except requests.RequestException as e:
-        error_msg = f"Request error: {str(e)}"
-        print(error_msg)
-        return {
-            "success": False,
-            "message": error_msg
-        }
-    except json.JSONDecodeError:
-        error_msg = f"Error parsing response: {response.text}"
-        print(error_msg)
+    success, status_message, result = _call_bridge("POST", _URL_DOWNLOAD, payload)
+    if result is None:
+        logger.error("%s", status_message)
         return {
             "success": False,
-            "message": error_msg
+            "message": status_message
         }
-    except Exception as e:
-        error_msg = f"Unexpected error: {str(e)}"
-        print(error_msg)
+    if not success:
+        logger.error("Download failed: %s", status_message)
         return {
             "success": False,
-            "message": error_msg
+            "message": f"Download failed: {status_message}"
         }
 
+    path = result.get("path")
+    public_url = result.get("public_url")  # Full public URL from bridge
+    media_type = result.get("media_type")
+    access_note = result.get("access_note")
+
+    logger.debug("Media downloaded: %s (public URL: %s, access note: %s)", path, public_url, access_note)
+
+    return {
+        "success": True,
+        "message": f"Successfully downloaded {media_type} media",
+        "filename": result.get("filename"),
+        "path": path,
+        "public_url": public_url,
+        "media_type": media_type,
+        "access_note": access_note
+    }
+
 
 # Scheduling functions
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScheduledMessage:
     id: int
     recipient: str
@@ -1344,74 +1808,125 @@ class ScheduledMessage:
 def schedule_message(recipient: str, message: str, scheduled_time: str, media_path: Optional[str] = None) -> Tuple[bool, str, Optional[int]]:
     """Schedule a WhatsApp message for future delivery.
 
+    The time is checked locally before anything is sent to the bridge, and is
+    forwarded in the RFC 3339 form the bridge expects.
+
     Args:
         recipient: Phone number or JID
         message: Message text
-        scheduled_time: ISO 8601 formatted datetime string
+        scheduled_time: ISO 8601 formatted datetime string including a UTC offset
         media_path: Optional path to media file
 
     Returns:
         Tuple of (success, status_message, scheduled_message_id)
     """
     try:
-        url = f"{WHATSAPP_API_BASE_URL}/schedule"
-        payload = {
-            "recipient": recipient,
-            "message": message,
-            "scheduled_time": scheduled_time
-        }
-        if media_path:
-            payload["media_path"] = media_path
+        parsed_time = _parse_iso_datetime(scheduled_time)
+    except (TypeError, ValueError):
+        return False, f"Invalid scheduled_time format: {scheduled_time}. Please use ISO-8601 format.", None
+    if parsed_time.tzinfo is None:
+        return False, f"scheduled_time must include a UTC offset (e.g. 2024-12-25T10:00:00Z): {scheduled_time}", None
+
+    payload = {
+        "recipient": recipient,
+        "message": message,
+        "scheduled_time": parsed_time.isoformat()
+    }
+    if media_path:
+        payload["media_path"] = media_path
+
+    success, status_message, result = _call_bridge("POST", _URL_SCHEDULE, payload)
+    if not success:
+        return False, status_message, None
+    return True, result.get("message", "Scheduled successfully"), result.get("id")
+
+
+def _fetch_scheduled_page(status: Optional[str], limit: int, cursor: Optional[str]) -> Optional[Tuple[List[dict], Optional[str], bool]]:
+    """Request one page of scheduled messages from the bridge, or None on error."""
+    params = {"limit": limit}
+    if status:
+        params["status"] = status
+    if cursor:
+        try:
+            params["after_time"], params["after_id"] = _decode_cursor(cursor, 2)
+        except ValueError as e:
+            logger.error("Unexpected error: %s", e)
+            return None
 
-        response = requests.post(url, json=payload)
-        result = response.json()
+    etag_key = (status, limit, cursor)
+    validated = _scheduled_etags.get(etag_key)
+    headers = {"If-None-Match": validated[0]} if validated else None
+    success, status_message, result = _call_bridge("GET", _URL_SCHEDULE, params=params, headers=headers)
+    if success and result is None and validated:
+        return validated[1]
+    if not success or result is None:
+        logger.warning("Failed to fetch scheduled messages: %s", status_message)
+        return None
 
-        if result.get("success", False):
-            return True, result.get("message", "Scheduled successfully"), result.get("id")
-        else:
-            return False, result.get("message", "Unknown error"), None
+    try:
+        messages = result.get("data") or []
+        has_more = result.get("has_more", False)
+        next_cursor = None
+        if has_more and messages:
+            next_cursor = _encode_cursor(messages[-1]["scheduled_time"], messages[-1]["id"])
+    except (KeyError, TypeError, AttributeError) as e:
+        logger.error("Unexpected error: %s", e)
+        return None
+    page = (messages, next_cursor, has_more)
+    if result.get("etag"):
+        _scheduled_etags.set(etag_key, (result["etag"], page))
+    return page
 
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}", None
-    except json.JSONDecodeError:
-        return False, f"Error parsing response", None
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}", None
 
+def list_scheduled_messages(
+    status: Optional[str] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> Optional[Tuple[List[dict], Optional[str], bool]]:
+    """Get one page of scheduled messages, optionally filtered by status.
 
-def list_scheduled_messages(status: Optional[str] = None) -> List[dict]:
-    """Get all scheduled messages, optionally filtered by status.
+    Messages are ordered by (scheduled_time, id). Pass the returned next_cursor
+    back in to fetch the following page.
 
     Args:
         status: Optional filter - 'pending', 'sent', or 'failed'
+        limit: Maximum number of messages to return (default 50)
+        cursor: Opaque cursor returned by a previous call (default None)
 
     Returns:
-        List of scheduled message dictionaries
+        Tuple of (scheduled message dictionaries, next_cursor, has_more), or
+        None if the bridge request failed
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/schedule"
-        params = {}
-        if status:
-            params["status"] = status
+    return _fetch_scheduled_page(status, limit, cursor)
 
-        response = requests.get(url, params=params)
-        result = response.json()
 
-        if result.get("success", False):
-            return result.get("data", [])
-        else:
-            print(f"Error: {result.get('message', 'Unknown error')}")
-            return []
+def iter_scheduled_messages(
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    page_size: int = 200
+) -> Iterator[dict]:
+    """Yield scheduled messages one at a time, following cursors page by page.
 
-    except requests.RequestException as e:
-        print(f"Request error: {str(e)}")
-        return []
-    except json.JSONDecodeError:
-        print(f"Error parsing response")
-        return []
-    except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        return []
+    Only the current page is held in memory, and stopping early skips the
+    remaining requests. Iteration ends quietly if a
+    page request fails.
+
+    Args:
+        status: Optional filter - 'pending', 'sent', or 'failed'
+        cursor: Opaque cursor to resume from (default None)
+        page_size: Messages requested per page (default 200)
+
+    Yields:
+        Scheduled message dictionaries in (scheduled_time, id) order
+    """
+    while True:
+        page = _fetch_scheduled_page(status, page_size, cursor)
+        if page is None:
+            return
+        messages, cursor, has_more = page
+        yield from messages
+        if not has_more or cursor is None:
+            return
 
 
 def cancel_scheduled_message(message_id: int) -> Tuple[bool, str]:
@@ -1423,26 +1938,13 @@ def cancel_scheduled_message(message_id: int) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, status_message)
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/schedule"
-        params = {"id": message_id}
-
-        response = requests.delete(url, params=params)
-        result = response.json()
-
-        return result.get("success", False), result.get("message", "Unknown error")
-
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    success, status_message, _ = _call_bridge("DELETE", _URL_SCHEDULE, params={"id": message_id})
+    return success, status_message
 
 
 # Channel watching functions
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WatchedChannel:
     jid: str
     name: str
@@ -1459,23 +1961,12 @@ def watch_channel(jid: str, name: Optional[str] = None) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, status_message)
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/watch"
-        payload = {"jid": jid}
-        if name:
-            payload["name"] = name
+    payload = {"jid": jid}
+    if name:
+        payload["name"] = name
 
-        response = requests.post(url, json=payload)
-        result = response.json()
-
-        return result.get("success", False), result.get("message", "Unknown error")
-
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    success, status_message, _ = _call_bridge("POST", _URL_WATCH, payload)
+    return success, status_message
 
 
 def unwatch_channel(jid: str) -> Tuple[bool, str]:
@@ -1487,53 +1978,76 @@ def unwatch_channel(jid: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, status_message)
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/watch"
-        params = {"jid": jid}
+    success, status_message, _ = _call_bridge("DELETE", _URL_WATCH, params={"jid": jid})
+    return success, status_message
 
-        response = requests.delete(url, params=params)
-        result = response.json()
 
-        return result.get("success", False), result.get("message", "Unknown error")
+def _watch_batch(method: str, payload: dict, count: int) -> List[Tuple[bool, str]]:
+    """Send a batched watch list change and unpack its per-item results.
 
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    The bridge reports top-level failure when any item failed, so per-item
+    results are read whenever the reply has them; only a reply without them
+    (transport error, malformed request) fails every item.
+    """
+    _, status_message, result = _call_bridge(method, _URL_WATCH_BATCH, payload)
+    if not result or not isinstance(result.get("results"), list):
+        return [(False, status_message)] * count
+    results = [
+        (item.get("success", False), item.get("message", "Unknown response"))
+        for item in result["results"]
+    ]
+    return results + [(False, "No result returned for this channel")] * (count - len(results))
+
+
+def watch_channels(channels: List[Tuple[str, Optional[str]]]) -> List[Tuple[bool, str]]:
+    """Add several channels to the watch list in one request.
+
+    The bridge stores them in a single transaction.
+
+    Args:
+        channels: (jid, name) pairs; name may be None to use the chat name
+
+    Returns:
+        One (success, status_message) tuple per channel, in the same order
+    """
+    if not channels:
+        return []
+    payload = {"channels": [{"jid": jid, "name": name or ""} for jid, name in channels]}
+    return _watch_batch("POST", payload, len(channels))
+
+
+def unwatch_channels(jids: List[str]) -> List[Tuple[bool, str]]:
+    """Remove several channels from the watch list in one request.
+
+    Args:
+        jids: JIDs of the channels to stop watching
+
+    Returns:
+        One (success, status_message) tuple per JID, in the same order
+    """
+    if not jids:
+        return []
+    return _watch_batch("DELETE", {"jids": list(jids)}, len(jids))
 
 
 def list_watched_channels() -> dict:
     """Get all watched channels.
 
     Returns:
-        Dictionary with channels list, count, and webhook_url
+        Dictionary with success, channels list, count, and webhook_url; on
+        failure success is False, the list is empty and message says why
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/watch"
-        response = requests.get(url)
-        result = response.json()
-
-        if result.get("success", False):
-            return {
-                "channels": result.get("channels", []),
-                "count": result.get("count", 0),
-                "webhook_url": result.get("webhook_url", "")
-            }
-        else:
-            print(f"Error: {result.get('message', 'Unknown error')}")
-            return {"channels": [], "count": 0, "webhook_url": ""}
-
-    except requests.RequestException as e:
-        print(f"Request error: {str(e)}")
-        return {"channels": [], "count": 0, "webhook_url": ""}
-    except json.JSONDecodeError:
-        print(f"Error parsing response")
-        return {"channels": [], "count": 0, "webhook_url": ""}
-    except Exception as e:
-        print(f"Unexpected error: {str(e)}")
-        return {"channels": [], "count": 0, "webhook_url": ""}
+    success, status_message, result = _call_bridge("GET", _URL_WATCH)
+    if not success:
+        logger.warning("Failed to fetch watched channels: %s", status_message)
+        return {"success": False, "message": status_message, "channels": [], "count": 0, "webhook_url": ""}
+
+    return {
+        "success": True,
+        "channels": result.get("channels", []),
+        "count": result.get("count", 0),
+        "webhook_url": result.get("webhook_url", "")
+    }
 
 
 # Chat archive functions
@@ -1548,24 +2062,8 @@ def archive_chat(jid: str, archive: bool = True) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, status_message)
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/archive"
-        payload = {
-            "jid": jid,
-            "archive": archive
-        }
-
-        response = requests.post(url, json=payload)
-        result = response.json()
-
-        return result.get("success", False), result.get("message", "Unknown error")
-
-    except requests.RequestException as e:
-        return False, f"Request error: {str(e)}"
-    except json.JSONDecodeError:
-        return False, f"Error parsing response"
-    except Exception as e:
-        return False, f"Unexpected error: {str(e)}"
+    success, status_message, _ = _call_bridge("POST", _URL_ARCHIVE, {"jid": jid, "archive": archive})
+    return success, status_message
 
 
 # App state resync functions
@@ -1592,43 +2090,33 @@ def resync_app_state(names: Optional[List[str]] = None, force: bool = False) ->
     Returns:
         A dictionary containing success status and per-state results
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/resync-state"
-        payload: dict = {}
-        if names:
-            payload["names"] = names
-        if force:
-            payload["force"] = True
-
-        response = requests.post(url, json=payload)
-        result = response.json()
-
-        return {
-            "success": result.get("success", False),
-            "message": result.get("message", "Unknown response"),
-            "results": result.get("results", [])
-        }
-
-    except requests.RequestException as e:
-        return {
-            "success": False,
-            "message": f"Request error: {str(e)}"
-        }
-    except json.JSONDecodeError:
-        return {
-            "success": False,
-            "message": f"Error parsing response: {response.text}"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"Unexpected error: {str(e)}"
-        }
+    payload: dict = {}
+    if names:
+        payload["names"] = names
+    if force:
+        payload["force"] = True
+
+    # A forced resync re-fetches every patch, so only connecting is time-limited
+    success, status_message, result = _call_bridge(
+        "POST", _URL_RESYNC_STATE, payload, timeout=(_HTTP_TIMEOUT[0], None)
+    )
+    if result is None:
+        return {"success": False, "message": status_message}
+
+    # Contact names arrive through app state, so cached ones may now be stale
+    if success:
+        clear_contact_cache()
+
+    return {
+        "success": success,
+        "message": result.get("message", "Unknown response"),
+        "results": result.get("results", [])
+    }
 
 
 # Group member management functions
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroupParticipant:
     jid: str
     name: Optional[str]
@@ -1636,7 +2124,7 @@ class GroupParticipant:
     is_super_admin: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroupInfo:
     jid: str
     name: str
@@ -1656,45 +2144,38 @@ def get_group_info(group_jid: str) -> dict:
     Returns:
         A dictionary containing group info and member list, or error information
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/group"
-        params = {"jid": group_jid}
-
-        response = requests.get(url, params=params)
-        result = response.json()
-
-        if result.get("success", False):
-            return {
-                "success": True,
-                "jid": result.get("jid"),
-                "name": result.get("name"),
-                "topic": result.get("topic"),
-                "owner_jid": result.get("owner_jid"),
-                "created_at": result.get("created_at"),
-                "participants": result.get("participants", []),
-                "participant_count": result.get("participant_count", 0)
-            }
-        else:
-            return {
-                "success": False,
-                "message": result.get("message", "Unknown error")
-            }
+    success, status_message, result = _call_bridge("GET", _URL_GROUP, params={"jid": group_jid})
+    if not success:
+        return {"success": False, "message": status_message}
+
+    return {
+        "success": True,
+        "jid": result.get("jid"),
+        "name": result.get("name"),
+        "topic": result.get("topic"),
+        "owner_jid": result.get("owner_jid"),
+        "created_at": result.get("created_at"),
+        "participants": result.get("participants", []),
+        "participant_count": result.get("participant_count", 0)
+    }
 
-    except requests.RequestException as e:
-        return {
-            "success": False,
-            "message": f"Request error: {str(e)}"
-        }
-    except json.JSONDecodeError:
-        return {
-            "success": False,
-            "message": "Error parsing response"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"Unexpected error: {str(e)}"
-        }
+
+def _group_members_call(method: str, group_jid: str, participants: List[str]) -> dict:
+    """Add (POST) or remove (DELETE) group members and shape the bridge's reply."""
+    payload = {
+        "group_jid": group_jid,
+        "participants": participants
+    }
+    success, status_message, result = _call_bridge(method, _URL_GROUP_MEMBERS, payload)
+    if result is None:
+        return {"success": False, "message": status_message}
+
+    return {
+        "success": success,
+        "message": status_message,
+        "group_jid": result.get("group_jid"),
+        "results": result.get("results", [])
+    }
 
 
 def add_group_members(group_jid: str, participants: List[str]) -> dict:
@@ -1707,38 +2188,7 @@ def add_group_members(group_jid: str, participants: List[str]) -> dict:
     Returns:
         A dictionary containing success status and results for each participant
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/group/members"
-        payload = {
-            "group_jid": group_jid,
-            "participants": participants
-        }
-
-        response = requests.post(url, json=payload)
-        result = response.json()
-
-        return {
-            "success": result.get("success", False),
-            "message": result.get("message", "Unknown error"),
-            "group_jid": result.get("group_jid"),
-            "results": result.get("results", [])
-        }
-
-    except requests.RequestException as e:
-        return {
-            "success": False,
-            "message": f"Request error: {str(e)}"
-        }
-    except json.JSONDecodeError:
-        return {
-            "success": False,
-            "message": "Error parsing response"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"Unexpected error: {str(e)}"
-        }
+    return _group_members_call("POST", group_jid, participants)
 
 
 def remove_group_members(group_jid: str, participants: List[str]) -> dict:
@@ -1751,35 +2201,4 @@ def remove_group_members(group_jid: str, participants: List[str]) -> dict:
     Returns:
         A dictionary containing success status and results for each participant
     """
-    try:
-        url = f"{WHATSAPP_API_BASE_URL}/group/members"
-        payload = {
-            "group_jid": group_jid,
-            "participants": participants
-        }
-
-        response = requests.delete(url, json=payload)
-        result = response.json()
-
-        return {
-            "success": result.get("success", False),
-            "message": result.get("message", "Unknown error"),
-            "group_jid": result.get("group_jid"),
-            "results": result.get("results", [])
-        }
-
-    except requests.RequestException as e:
-        return {
-            "success": False,
-            "message": f"Request error: {str(e)}"
-        }
-    except json.JSONDecodeError:
-        return {
-            "success": False,
-            "message": "Error parsing response"
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "message": f"Unexpected error: {str(e)}"
-        }
+    return _group_members_call("DELETE", group_jid, participants)